@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+config.py
+Immutable runtime configuration, read from the environment once per process.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Snapshot of the scraper's environment configuration."""
+
+    database_url: str
+    voyage_api_key: str = ""
+    health_port: int = 8080
+    scrape_interval_minutes: int = 60
+    requests_per_minute: int = 20
+    # Peak demand: 4 spiders x 2 in-flight flushes, plus the embedding worker
+    db_pool_size: int = 10
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Build a Config from the current process environment."""
+        return cls(
+            database_url=os.getenv("DATABASE_URL", ""),
+            voyage_api_key=os.getenv("VOYAGE_API_KEY", ""),
+            health_port=int(os.getenv("HEALTH_PORT", "8080")),
+            scrape_interval_minutes=int(os.getenv("SCRAPE_INTERVAL_MINUTES", "60")),
+            requests_per_minute=int(os.getenv("REQUESTS_PER_MINUTE", "20")),
+            db_pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Load .env (once) and return the memoized Config."""
+    load_dotenv()
+    return Config.from_env()
@@ -2,13 +2,21 @@
 """
 embedding_service.py
 Voyage AI embedding client with rate-limiting and batch processing.
+
+CHANGELOG:
+- Document embeds from concurrent callers are coalesced into shared
+  Voyage requests (50 ms window, up to max_batch_size texts)
+- RPM limiting uses a shared TokenBucket (safe under concurrent requests)
+- EmbeddingWorker fetches full Voyage-sized batches and drains backlog
+  without sleeping between full batches
+- embed_scraped_jobs() builds embedding text straight from model
+  attributes (no per-job dict round-trip)
 """
 
 import asyncio
 import logging
-import time
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Tuple
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -17,6 +25,8 @@ from tenacity import (
     before_sleep_log,
 )
 
+from utils import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 # Try to import voyageai - handle gracefully if not installed
@@ -38,6 +48,7 @@ class VoyageEmbeddingService:
     - Batch processing (128 texts per request max)
     - Tenacity retry with exponential backoff
     - Token consumption tracking
+    - Micro-batching of concurrent document embeds
     """
 
     # Voyage AI limits
@@ -46,6 +57,7 @@ class VoyageEmbeddingService:
     MAX_BATCH_SIZE = 128
     MAX_RPM = 300
     MAX_TOKENS_PER_REQUEST = 120000
+    COALESCE_WINDOW_SECONDS = 0.05
     
     def __init__(
         self,
@@ -53,6 +65,7 @@ class VoyageEmbeddingService:
         model: Optional[str] = None,
         max_rpm: int = 300,
         max_batch_size: int = 128,
+        max_concurrent: int = 5,
     ):
         """
         Initialize Voyage AI embedding service.
@@ -62,6 +75,7 @@ class VoyageEmbeddingService:
             model: Model name (default: voyage-3.5-lite)
             max_rpm: Maximum requests per minute
             max_batch_size: Maximum texts per API call
+            max_concurrent: Maximum in-flight API calls
         """
         if not VOYAGE_AVAILABLE:
             raise ImportError(
@@ -76,10 +90,14 @@ class VoyageEmbeddingService:
         # Initialize client
         self.client = voyageai.Client(api_key=api_key)
         
-        # Rate limiting
-        self.min_interval = 60.0 / max_rpm
-        self.last_request_time = 0
-        self._semaphore = asyncio.Semaphore(5)  # Max concurrent requests
+        # Rate limiting: token bucket for RPM, semaphore for in-flight calls
+        self._limiter = TokenBucket(rate=max_rpm, period=60.0)
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+        # Micro-batching (created lazily inside the running loop)
+        self._pending: Optional[asyncio.Queue] = None
+        self._coalescer: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()  # Strong refs to in-flight requests
         
         # Metrics
         self.total_tokens_consumed = 0
@@ -94,12 +112,8 @@ class VoyageEmbeddingService:
         })
     
     async def _rate_limit(self):
-        """Enforce rate limiting between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_interval:
-            wait_time = self.min_interval - elapsed
-            await asyncio.sleep(wait_time)
-        self.last_request_time = time.time()
+        """Enforce the requests-per-minute budget across concurrent callers."""
+        await self._limiter.acquire()
     
     def _prepare_text(self, job: Dict[str, Any]) -> str:
         """
@@ -117,15 +131,42 @@ class VoyageEmbeddingService:
         enabling more accurate vector search for queries like:
         "remote React developer in New York $120k+"
         """
+        return self._build_text(
+            title=job.get('job_title', '') or job.get('title', ''),
+            skills=job.get('skills_required', []),
+            description=job.get('job_description', '') or job.get('description', ''),
+            location=job.get('location', ''),
+            remote=job.get('remote', False),
+            job_type=job.get('job_type', ''),
+            salary_min=job.get('salary_min'),
+            salary_max=job.get('salary_max'),
+            experience=job.get('experience_required', ''),
+            company=job.get('company_name', '') or job.get('company', ''),
+            industry=job.get('industry', ''),
+        )
+
+    def _build_text(
+        self,
+        title: str,
+        skills,
+        description: str,
+        location: Optional[str],
+        remote: bool,
+        job_type: Optional[str],
+        salary_min,
+        salary_max,
+        experience: Optional[str],
+        company: str,
+        industry: Optional[str] = "",
+    ) -> str:
+        """Assemble the weighted embedding text from individual job fields."""
         parts = []
         
         # Job title (high weight — repeat 3x for emphasis)
-        title = job.get('job_title', '') or job.get('title', '')
         if title:
             parts.extend([f"Job Title: {title}"] * 3)
         
         # Skills (high weight — repeated 2x)
-        skills = job.get('skills_required', [])
         if skills:
             if isinstance(skills, list):
                 skills_text = ', '.join(str(s) for s in skills)
@@ -134,28 +175,22 @@ class VoyageEmbeddingService:
             parts.extend([f"Skills: {skills_text}"] * 2)
         
         # Description (medium-high weight, truncated)
-        description = job.get('job_description', '') or job.get('description', '')
         if description:
             parts.append(description[:3000])
         
         # Location (important for geo-based search)
-        location = job.get('location', '')
         if location:
             parts.append(f"Location: {location}")
         
         # Remote status (critical for modern job search)
-        remote = job.get('remote', False)
         if remote:
             parts.append("Work Type: Remote, Work from home, WFH")
         
         # Job type (full-time, part-time, contract, etc.)
-        job_type = job.get('job_type', '')
         if job_type:
             parts.append(f"Employment Type: {job_type}")
         
         # Salary range (important for salary-based queries)
-        salary_min = job.get('salary_min')
-        salary_max = job.get('salary_max')
         if salary_min or salary_max:
             salary_parts = []
             if salary_min:
@@ -165,17 +200,14 @@ class VoyageEmbeddingService:
             parts.append(f"Salary Range: {' - '.join(salary_parts)} per year")
         
         # Experience level
-        experience = job.get('experience_required', '')
         if experience:
             parts.append(f"Experience Required: {experience}")
         
         # Company name (low weight)
-        company = job.get('company_name', '') or job.get('company', '')
         if company:
             parts.append(f"Company: {company}")
         
         # Industry (low weight)
-        industry = job.get('industry', '')
         if industry:
             parts.append(f"Industry: {industry}")
         
@@ -226,11 +258,12 @@ class VoyageEmbeddingService:
                 if hasattr(result, 'total_tokens'):
                     self.total_tokens_consumed += result.total_tokens
                 
-                logger.debug({
-                    "event": "embedding_batch_complete",
-                    "texts": len(texts),
-                    "tokens": getattr(result, 'total_tokens', 0),
-                })
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug({
+                        "event": "embedding_batch_complete",
+                        "texts": len(texts),
+                        "tokens": getattr(result, 'total_tokens', 0),
+                    })
                 
                 return result.embeddings
                 
@@ -258,28 +291,118 @@ class VoyageEmbeddingService:
         input_type: str = "document"
     ) -> List[List[float]]:
         """
-        Embed a batch of texts with automatic chunking.
-        
+        Embed a batch of texts.
+
+        Document texts are queued for the coalescer, which packs texts from
+        all concurrent callers into full-size requests. Queries go direct.
+
         Args:
             texts: List of texts to embed
             input_type: "document" or "query"
-            
+
         Returns:
             List of embedding vectors
         """
         if not texts:
             return []
-        
-        all_embeddings = []
-        
-        # Process in chunks respecting max batch size
-        for i in range(0, len(texts), self.max_batch_size):
-            chunk = texts[i:i + self.max_batch_size]
-            embeddings = await self._embed_batch_request(chunk, input_type)
-            all_embeddings.extend(embeddings)
-        
-        return all_embeddings
-    
+
+        if input_type != "document":
+            all_embeddings = []
+            # Process in chunks respecting max batch size
+            for i in range(0, len(texts), self.max_batch_size):
+                chunk = texts[i:i + self.max_batch_size]
+                embeddings = await self._embed_batch_request(chunk, input_type)
+                all_embeddings.extend(embeddings)
+            return all_embeddings
+
+        self._ensure_coalescer()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            fut = loop.create_future()
+            self._pending.put_nowait((text, fut))
+            futures.append(fut)
+        return list(await asyncio.gather(*futures))
+
+    def _ensure_coalescer(self):
+        if self._coalescer is None or self._coalescer.done():
+            self._pending = asyncio.Queue()
+            self._coalescer = asyncio.create_task(self._coalesce())
+
+    async def _coalesce(self):
+        """Pull queued texts and dispatch them in full-size requests."""
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[str, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await self._pending.get()]
+                deadline = loop.time() + self.COALESCE_WINDOW_SECONDS
+                while len(batch) < self.max_batch_size:
+                    if not self._pending.empty():
+                        batch.append(self._pending.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._pending.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                # Requests run concurrently, bounded by self._semaphore. The
+                # loop only keeps weak refs to tasks, so hold them here.
+                task = asyncio.create_task(self._flush(batch))
+                self._flushes.add(task)
+                task.add_done_callback(self._flushes.discard)
+                batch = []
+        finally:
+            # Stopped mid-collection: nobody will dispatch this batch
+            self._fail_futures(batch)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]):
+        try:
+            embeddings = await self._embed_batch_request([text for text, _ in batch])
+        except Exception as e:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        else:
+            for (_, fut), embedding in zip(batch, embeddings):
+                if not fut.done():
+                    fut.set_result(embedding)
+        finally:
+            # Cancelled, or Voyage returned fewer vectors than texts
+            self._fail_futures(batch)
+
+    @staticmethod
+    def _fail_futures(batch: List[Tuple[str, asyncio.Future]]):
+        """Resolve any still-pending futures so their callers never hang."""
+        for _, fut in batch:
+            if not fut.done():
+                fut.set_exception(RuntimeError("Embedding request was not completed"))
+
+    async def close(self):
+        """
+        Stop the coalescer, let in-flight requests finish, and fail anything
+        still queued so awaiting callers are released.
+        """
+        if self._coalescer and not self._coalescer.done():
+            self._coalescer.cancel()
+            try:
+                await self._coalescer
+            except asyncio.CancelledError:
+                pass
+        self._coalescer = None
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+        if self._pending is not None:
+            queued = []
+            while not self._pending.empty():
+                queued.append(self._pending.get_nowait())
+            self._fail_futures(queued)
+
     async def embed_jobs(
         self,
         jobs: List[Dict[str, Any]]
@@ -329,6 +452,46 @@ class VoyageEmbeddingService:
                 job['embedding'] = None
             return jobs
     
+    async def embed_scraped_jobs(self, jobs: List[Any]) -> List[Optional[List[float]]]:
+        """
+        Embed ScrapedJob models directly, returning one embedding per job.
+
+        Reads the model attributes straight into the weighted text, so no
+        intermediate per-job dict is built. Failed items come back as None.
+        """
+        if not jobs:
+            return []
+
+        texts = [
+            self._build_text(
+                title=job.title,
+                skills=job.skills_required,
+                description=job.description,
+                location=job.location,
+                remote=job.remote,
+                job_type=job.job_type,
+                salary_min=float(job.salary_min) if job.salary_min else None,
+                salary_max=float(job.salary_max) if job.salary_max else None,
+                experience=job.experience_required,
+                company=job.company_name,
+            )
+            for job in jobs
+        ]
+
+        try:
+            embeddings = await self.embed_batch(texts)
+        except Exception as e:
+            logger.error(f"Failed to embed jobs: {e}")
+            return [None] * len(jobs)
+
+        logger.info({
+            "event": "embedding_jobs_complete",
+            "total": len(jobs),
+            "successful": sum(1 for emb in embeddings if emb),
+            "tokens_consumed": self.total_tokens_consumed,
+        })
+        return embeddings
+
     async def embed_query(self, query: str) -> List[float]:
         """
         Embed a search query.
@@ -360,7 +523,7 @@ class EmbeddingWorker:
         self,
         database,
         embedding_service: VoyageEmbeddingService,
-        batch_size: int = 50,
+        batch_size: Optional[int] = None,
         interval_seconds: int = 60,
     ):
         """
@@ -369,12 +532,16 @@ class EmbeddingWorker:
         Args:
             database: Database instance
             embedding_service: VoyageEmbeddingService instance
-            batch_size: Jobs to process per cycle
+            batch_size: Jobs to process per cycle (default: one full
+                Voyage request, i.e. the service's max_batch_size)
             interval_seconds: Time between cycles
         """
         self.db = database
         self.embedder = embedding_service
-        self.batch_size = batch_size
+        self.batch_size = min(
+            batch_size or embedding_service.max_batch_size,
+            embedding_service.max_batch_size,
+        )
         self.interval = interval_seconds
         self.running = False
     
@@ -387,7 +554,8 @@ class EmbeddingWorker:
             try:
                 # Fetch jobs needing embeddings
                 jobs = await self.db.get_jobs_without_embeddings(self.batch_size)
-                
+                updated = 0
+
                 if jobs:
                     logger.info(f"Processing {len(jobs)} jobs for embeddings")
                     
@@ -402,12 +570,17 @@ class EmbeddingWorker:
                     ]
                     
                     if updates:
-                        await self.db.update_embeddings_batch(updates)
-                        logger.info(f"Updated {len(updates)} embeddings")
+                        updated = await self.db.update_embeddings_batch(updates)
+                        logger.info(f"Updated {updated} embeddings")
                 else:
                     logger.debug("No jobs pending embeddings")
-                
-                await asyncio.sleep(self.interval)
+
+                # A full batch written back means there is likely more
+                # backlog — keep draining instead of idling for an interval.
+                # Anything less (including a failed write) waits, so a
+                # failing DB never has the same rows re-embedded in a loop.
+                if updated < self.batch_size:
+                    await asyncio.sleep(self.interval)
                 
             except Exception as e:
                 logger.error(f"Embedding worker error: {e}")
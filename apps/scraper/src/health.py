@@ -7,12 +7,21 @@ Health check HTTP endpoint for container orchestration.
 import asyncio
 import logging
 from aiohttp import web
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 
+def _json_response(payload: Dict[str, Any], status: int = 200) -> web.Response:
+    """JSON response serialized with orjson (bytes, no str round-trip)."""
+    return web.Response(
+        body=orjson.dumps(payload), status=status, content_type="application/json"
+    )
+
+
 class HealthCheckServer:
     """Lightweight HTTP server for health checks."""
 
@@ -21,7 +30,7 @@ class HealthCheckServer:
         self.app = web.Application()
         self.runner = None
         self.site = None
-        self.start_time = datetime.utcnow()
+        self.start_time = datetime.now(timezone.utc)
 
         # Health status
         self.status = {
@@ -40,16 +49,16 @@ class HealthCheckServer:
 
     async def health_check(self, request) -> web.Response:
         """Liveness probe."""
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        uptime = (datetime.now(timezone.utc) - self.start_time).total_seconds()
         consecutive_failures = self.status.get("consecutive_failures", 0)
         is_healthy = self.status["healthy"] and consecutive_failures < 3
         
-        return web.json_response(
+        return _json_response(
             {
                 "status": "healthy" if is_healthy else "unhealthy",
                 "uptime_seconds": uptime,
                 "consecutive_failures": consecutive_failures,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
             },
             status=200 if is_healthy else 503,
         )
@@ -57,19 +66,19 @@ class HealthCheckServer:
     async def readiness_check(self, request) -> web.Response:
         """Readiness probe — only requires DB connection."""
         ready = self.status["database_connected"]
-        return web.json_response(
+        return _json_response(
             {
                 "ready": ready,
                 "database": self.status["database_connected"],
                 "last_scrape": self.status["last_scrape"],
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
             },
             status=200 if ready else 503,
         )
 
     async def metrics(self, request) -> web.Response:
         """Prometheus-style metrics endpoint."""
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        uptime = (datetime.now(timezone.utc) - self.start_time).total_seconds()
 
         metrics_text = f"""# HELP scraper_uptime_seconds Total uptime in seconds
 # TYPE scraper_uptime_seconds gauge
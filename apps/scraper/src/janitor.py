@@ -7,6 +7,7 @@ Works with the Drizzle-managed `jobs` table.
 
 import asyncio
 import logging
+import time
 from typing import Dict, Any
 from datetime import datetime
 
@@ -76,6 +77,7 @@ class JanitorService:
         """Execute all maintenance tasks."""
         logger.info("=== Starting Janitor Maintenance ===")
         start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         summary = {
             "started_at": start_time.isoformat(),
@@ -88,9 +90,8 @@ class JanitorService:
             summary["tasks"]["old_removed"] = await self.remove_old_jobs()
             summary["tasks"]["duplicates_removed"] = await self.remove_duplicates()
 
-            end_time = datetime.now()
-            summary["completed_at"] = end_time.isoformat()
-            summary["duration_seconds"] = (end_time - start_time).total_seconds()
+            summary["completed_at"] = datetime.now().isoformat()
+            summary["duration_seconds"] = (time.perf_counter_ns() - start_ns) / 1e9
             summary["success"] = True
 
             logger.info(
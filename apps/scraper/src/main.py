@@ -8,6 +8,17 @@ CHANGELOG:
 - Updated spider call to pass known_ids for detail fetching bypass
 - Changed scheduler.shutdown(wait=False) to wait=True to fix shutdown race 
 - Pushing _consecutive_failures to the health server payload
+- Run on uvloop when installed and enable the eager task factory on 3.12+
+- API spiders share one aiohttp session/connector (keep-alive + DNS cache)
+- Config is read once into a frozen Config snapshot and passed in
+- A late scrape run gets a full interval of misfire grace instead of being dropped
+- main() waits on a shutdown Event set by the signal handler (no polling)
+- Spiders run concurrently within a cycle
+- Full batches flush in the background so spiders keep fetching
+- ScraperSystem owns the CPU process pool used for HTML cleaning
+- Every batch flush (including the last) is awaited and its failure reported per batch
+- A spider waits for a free flush slot instead of queueing batches without bound
+- Known IDs come from the pipeline's filter warm-up instead of a second table scan
 """
 
 import asyncio
@@ -16,8 +27,10 @@ import os
 import signal
 import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import List, Optional, Tuple
 
 # Suppress urllib3 NotOpenSSLWarning (common on macOS with LibreSSL)
 try:
@@ -26,18 +39,26 @@ try:
 except ImportError:
     pass
 
-from dotenv import load_dotenv
+# uvloop is optional (not available on Windows) — fall back to the stock loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+import aiohttp
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 # Local imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from config import Config, get_config
 from database import Database
 from pipeline import JobProcessingPipeline
 from embedding_service import VoyageEmbeddingService, EmbeddingWorker
 from spiders.remotive import RemotiveSpider
 from spiders.arbeitnow import ArbeitnowSpider
 from spiders.greenhouse import GreenhouseSpider
+from spiders.base import create_http_session
 
 # HiringCafeSpider requires playwright — import conditionally
 try:
@@ -93,15 +114,14 @@ class ScraperSystem:
     Orchestrator that coordinates scraping, processing, and maintenance.
     """
 
-    def __init__(self):
-        load_dotenv()
-
+    def __init__(self, config: Optional[Config] = None):
         # Config
-        self.database_url = os.getenv("DATABASE_URL", "")
-        self.voyage_api_key = os.getenv("VOYAGE_API_KEY", "")
-        self.health_port = int(os.getenv("HEALTH_PORT", "8080"))
-        self.scrape_interval_minutes = int(os.getenv("SCRAPE_INTERVAL_MINUTES", "60"))
-        self.requests_per_minute = int(os.getenv("REQUESTS_PER_MINUTE", "20"))
+        self.config = config or get_config()
+        self.database_url = self.config.database_url
+        self.voyage_api_key = self.config.voyage_api_key
+        self.health_port = self.config.health_port
+        self.scrape_interval_minutes = self.config.scrape_interval_minutes
+        self.requests_per_minute = self.config.requests_per_minute
 
         if not self.database_url:
             raise ValueError("DATABASE_URL is required")
@@ -109,6 +129,8 @@ class ScraperSystem:
         # Components (initialized in start())
         self.db: Database = None
         self.spiders: list = []  # All spider instances
+        self.http_session: aiohttp.ClientSession = None  # Shared by API spiders
+        self.cpu_pool: ProcessPoolExecutor = None  # HTML cleaning for API spiders
         self.pipeline: JobProcessingPipeline = None
         self.embedder: VoyageEmbeddingService = None
         self.embedding_worker: EmbeddingWorker = None
@@ -119,6 +141,8 @@ class ScraperSystem:
         # State
         self._running = False
         self._stopping = False
+        self._shutdown_event = asyncio.Event()  # Set to wake main() for shutdown
+        self._embedding_task: Optional[asyncio.Task] = None
         self._cycle_count = 0
         self._consecutive_failures: int = 0
 
@@ -127,7 +151,7 @@ class ScraperSystem:
         logger.info("Starting scraper system...")
 
         # 1. Database
-        self.db = Database(self.database_url)
+        self.db = Database(self.database_url, pool_size=self.config.db_pool_size)
         await self.db.connect()
 
         # 2. Embedding service (optional — runs without if no key)
@@ -137,7 +161,6 @@ class ScraperSystem:
                 self.embedding_worker = EmbeddingWorker(
                     database=self.db,
                     embedding_service=self.embedder,
-                    batch_size=50,
                     interval_seconds=120,
                 )
                 logger.info("Voyage AI embeddings enabled")
@@ -148,15 +171,30 @@ class ScraperSystem:
             logger.warning("No VOYAGE_API_KEY — embeddings disabled")
 
         # 3. Spiders — API-based sources (always available) + hiring.cafe (if playwright installed)
+        # One connector for all API spiders: keep-alive reuse + cached DNS
+        self.http_session = create_http_session(
+            aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=20,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+        )
+        # CPU-bound HTML → text conversion runs across cores, off the loop
+        self.cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        shared = {"session": self.http_session, "cpu_pool": self.cpu_pool}
         self.spiders = [
-            RemotiveSpider(requests_per_minute=2),      # TOS: max 2 req/min
-            ArbeitnowSpider(requests_per_minute=20),    # Generous limits
-            GreenhouseSpider(requests_per_minute=30),   # Per-board, very fast
+            RemotiveSpider(requests_per_minute=2, **shared),      # TOS: max 2 req/min
+            ArbeitnowSpider(requests_per_minute=20, **shared),    # Generous limits
+            GreenhouseSpider(requests_per_minute=30, **shared),   # Per-board, very fast
         ]
 
         if HIRING_CAFE_AVAILABLE and HiringCafeSpider:
             self.spiders.append(
-                HiringCafeSpider(requests_per_minute=self.requests_per_minute)
+                HiringCafeSpider(
+                    requests_per_minute=self.requests_per_minute,
+                    cpu_pool=self.cpu_pool,
+                )
             )
             logger.info("HiringCafeSpider enabled (playwright found)")
         else:
@@ -189,6 +227,9 @@ class ScraperSystem:
             minutes=self.scrape_interval_minutes,
             id="scrape_cycle",
             next_run_time=datetime.now(timezone.utc),  # Run immediately
+            # Runs already never overlap and are coalesced (APScheduler's
+            # defaults); a run woken late is still taken, not dropped after 1 s
+            misfire_grace_time=self.scrape_interval_minutes * 60,
         )
         self.scheduler.add_job(
             self._maintenance_cycle,
@@ -200,7 +241,7 @@ class ScraperSystem:
 
         # 8. Embedding worker (background)
         if self.embedding_worker:
-            asyncio.create_task(self.embedding_worker.start())
+            self._embedding_task = asyncio.create_task(self.embedding_worker.start())
 
         self._running = True
         logger.info({
@@ -211,77 +252,26 @@ class ScraperSystem:
         })
 
     async def _run_pipeline(self):
-        """Isolated scraping orchestration logic — runs ALL spiders sequentially."""
+        """Isolated scraping orchestration logic — runs ALL spiders concurrently."""
         self._cycle_count += 1
         cycle = self._cycle_count
 
         logger.info({"event": "cycle_start", "cycle": cycle})
 
-        # Shared known IDs for cross-source dedup
-        known_ids = await self.db.get_all_source_ids()
+        # Shared known IDs for cross-source dedup, built in the same pass
+        # over the table that warms the pipeline's dedup filter
+        known_ids = await self.pipeline.reset_cycle()
         logger.info(f"Loaded {len(known_ids)} known IDs for cross-source dedup")
 
-        total_scraped = 0
-        total_stored = 0
-        source_results = {}
-
-        for spider in self.spiders:
-            source_name = getattr(spider, 'SOURCE_NAME', 'hiring_cafe')
-            spider_scraped = 0
-            spider_stored = 0
-            batch = []
-
-            try:
-                logger.info(f"--- Starting spider: {source_name} ---")
-
-                async for job in spider.scrape(known_ids=known_ids):
-                    batch.append(job)
-                    spider_scraped += 1
-
-                    if len(batch) >= self.pipeline.batch_size:
-                        logger.info(f"[{source_name}] Batch full ({len(batch)} jobs). Processing...")
-                        metrics = await self.pipeline.process(batch)
-                        spider_stored += metrics.jobs_stored
-                        batch = []
-
-                        # Update health periodically
-                        self.health.update_status(
-                            last_scrape=datetime.now(timezone.utc).isoformat(),
-                            jobs_in_db=(await self.db.get_stats()).get("total_jobs", 0),
-                            consecutive_failures=self._consecutive_failures,
-                        )
-
-                # Process remaining jobs in the last batch
-                if batch:
-                    metrics = await self.pipeline.process(batch)
-                    spider_stored += metrics.jobs_stored
-
-                total_scraped += spider_scraped
-                total_stored += spider_stored
-                source_results[source_name] = {
-                    "scraped": spider_scraped,
-                    "stored": spider_stored,
-                    "errors": spider.errors,
-                }
-
-                logger.info(f"--- Spider {source_name} complete: "
-                           f"scraped={spider_scraped}, stored={spider_stored}, "
-                           f"errors={spider.errors} ---")
+        # Spiders hit different hosts and each throttles itself, so run them
+        # side by side; the pipeline is reentrant across concurrent batches.
+        results = await asyncio.gather(
+            *(self._run_spider(spider, known_ids) for spider in self.spiders)
+        )
 
-            except Exception as e:
-                logger.error(f"Spider {source_name} crashed: {e}", exc_info=True)
-                source_results[source_name] = {
-                    "scraped": spider_scraped,
-                    "stored": spider_stored,
-                    "error": str(e),
-                }
-            finally:
-                # Reset spider metrics for next cycle
-                spider.jobs_found = 0
-                spider.pages_scraped = 0
-                spider.errors = 0
-                if hasattr(spider, 'detail_fetches'):
-                    spider.detail_fetches = 0
+        source_results = dict(results)
+        total_scraped = sum(r["scraped"] for r in source_results.values())
+        total_stored = sum(r["stored"] for r in source_results.values())
 
         logger.info({
             "event": "cycle_complete",
@@ -300,6 +290,105 @@ class ScraperSystem:
             by_source=stats.get("by_source", {}),
         )
 
+    async def _run_spider(self, spider, known_ids: set) -> tuple:
+        """
+        Scrape one source and push its jobs through the pipeline in batches.
+
+        Batches are flushed in the background (at most two at a time) so
+        the spider keeps fetching while the previous batch is embedded and
+        stored; a third full batch waits for a free slot, so a fast source
+        can't queue batches without bound. Every flush is awaited before
+        the spider reports, and a failed flush is counted against the
+        batch, not the spider.
+        """
+        source_name = getattr(spider, 'SOURCE_NAME', 'hiring_cafe')
+        spider_scraped = 0
+        batch = []
+        flushes: List[asyncio.Task] = []
+        flush_sema = asyncio.Semaphore(2)
+
+        async def flush(jobs: list):
+            # The slot is taken by the caller before the task is created
+            try:
+                return await self.pipeline.process(jobs)
+            finally:
+                flush_sema.release()
+
+        async def start_flush(jobs: list):
+            await flush_sema.acquire()
+            flushes.append(asyncio.create_task(flush(jobs)))
+
+        try:
+            logger.info(f"--- Starting spider: {source_name} ---")
+
+            async for job in spider.scrape(known_ids=known_ids):
+                batch.append(job)
+                spider_scraped += 1
+
+                if len(batch) >= self.pipeline.batch_size:
+                    logger.info(f"[{source_name}] Batch full ({len(batch)} jobs). Processing...")
+                    batch, full = [], batch
+                    await start_flush(full)
+
+            # Process remaining jobs in the last batch
+            if batch:
+                await start_flush(batch)
+            spider_stored, flush_errors = await self._settle_flushes(source_name, flushes)
+
+            result = {
+                "scraped": spider_scraped,
+                "stored": spider_stored,
+                "errors": spider.errors + flush_errors,
+            }
+
+            logger.info(f"--- Spider {source_name} complete: "
+                       f"scraped={spider_scraped}, stored={spider_stored}, "
+                       f"errors={result['errors']} ---")
+
+        except Exception as e:
+            logger.error(f"Spider {source_name} crashed: {e}", exc_info=True)
+            # Let batches already handed off finish rather than orphan them
+            spider_stored, _ = await self._settle_flushes(source_name, flushes)
+            result = {
+                "scraped": spider_scraped,
+                "stored": spider_stored,
+                "error": str(e),
+            }
+        finally:
+            # Only left running if we were cancelled — don't orphan them
+            pending = [task for task in flushes if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            # Reset spider metrics for next cycle
+            spider.jobs_found = 0
+            spider.pages_scraped = 0
+            spider.errors = 0
+            if hasattr(spider, 'detail_fetches'):
+                spider.detail_fetches = 0
+
+        # Cheap per-source heartbeat; jobs_in_db is refreshed once per cycle
+        self.health.update_status(
+            last_scrape=datetime.now(timezone.utc).isoformat(),
+            consecutive_failures=self._consecutive_failures,
+        )
+        return source_name, result
+
+    @staticmethod
+    async def _settle_flushes(source_name: str, flushes: List[asyncio.Task]) -> Tuple[int, int]:
+        """Await every batch flush; return (jobs stored, failed flushes)."""
+        stored = failed = 0
+        for outcome in await asyncio.gather(*flushes, return_exceptions=True):
+            if isinstance(outcome, BaseException):
+                failed += 1
+                logger.error(
+                    f"[{source_name}] Batch processing failed: {outcome}",
+                    exc_info=outcome,
+                )
+            else:
+                stored += outcome.jobs_stored
+        return stored, failed
 
     async def _scrape_cycle(self):
         """Execute one full scrape → process → store cycle inside resilience wrapper."""
@@ -355,13 +444,25 @@ class ScraperSystem:
             except Exception as e:
                 logger.warning(f"Scheduler shutdown interrupted — job may have been mid-run: {e}")
 
-        # Stop other background tasks
+        # Stop other background tasks — cancel the worker rather than
+        # waiting out its sleep interval
         if self.embedding_worker:
             try:
                 self.embedding_worker.stop()
+                if self._embedding_task and not self._embedding_task.done():
+                    self._embedding_task.cancel()
+                    await asyncio.wait_for(self._embedding_task, timeout=5)
+            except asyncio.CancelledError:
+                pass
             except Exception as e:
                 logger.warning(f"Error stopping embedding worker: {e}")
 
+        if self.embedder:
+            try:
+                await self.embedder.close()
+            except Exception as e:
+                logger.warning(f"Error closing embedding service: {e}")
+
         # Close all spiders
         for spider in self.spiders:
             try:
@@ -370,6 +471,17 @@ class ScraperSystem:
                 source_name = getattr(spider, 'SOURCE_NAME', 'unknown')
                 logger.warning(f"Error closing spider {source_name}: {e}")
 
+        if self.http_session and not self.http_session.closed:
+            try:
+                await self.http_session.close()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP session: {e}")
+
+        if self.cpu_pool:
+            # Spiders are closed, so nothing new is submitted; don't block the
+            # loop waiting on workers and drop any queued conversions
+            self.cpu_pool.shutdown(wait=False, cancel_futures=True)
+
         # Stop health server
         if self.health:
             try:
@@ -392,14 +504,22 @@ class ScraperSystem:
 async def main():
     setup_logging()
 
-    system = ScraperSystem()
+    system = ScraperSystem(get_config())
+
+    # Tasks whose first await is already resolved run inline (Python 3.12+)
+    loop = asyncio.get_running_loop()
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    logger.info(f"Event loop: {type(loop).__module__}.{type(loop).__name__}, "
+                f"eager tasks: {eager_task_factory is not None}")
 
     # Handle signals for graceful shutdown
-    # We simply set _running to False to break the loop; 
+    # We set the shutdown event to wake main immediately;
     # the finally block will handle the component shutdown.
-    loop = asyncio.get_event_loop()
     def signal_handler():
         system._running = False
+        system._shutdown_event.set()
         logger.info("Interrupt received, stopping...")
 
     for sig in (signal.SIGINT, signal.SIGTERM):
@@ -408,9 +528,8 @@ async def main():
     try:
         await system.start()
 
-        # Keep running until stopped
-        while system._running:
-            await asyncio.sleep(1)
+        # Keep running until a signal sets the shutdown event
+        await system._shutdown_event.wait()
 
     except KeyboardInterrupt:
         pass
@@ -421,4 +540,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
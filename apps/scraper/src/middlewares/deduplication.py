@@ -4,10 +4,15 @@ deduplication.py
 Lightweight dedup — uses requisition_id / source_url for uniqueness.
 
 SHA-256 fingerprinting removed — hiring.cafe provides stable IDs.
+Known DB URLs are held in a Bloom filter; positives are confirmed by the DB.
 """
 
+import asyncio
 import logging
-from typing import Optional, Set
+from collections import OrderedDict
+from typing import List, Optional, Set
+
+from utils import BloomFilter
 
 logger = logging.getLogger(__name__)
 
@@ -18,24 +23,59 @@ class DeduplicationCache:
     Checks source_url uniqueness before inserting.
     """
 
-    def __init__(self, database=None):
+    def __init__(self, database=None, max_seen: int = 100_000):
         self.db = database
-        self._seen: Set[str] = set()  # URLs seen in current batch
-        self._db_urls: Optional[Set[str]] = None  # Cached from DB
+        # URLs seen recently — bounded LRU so long-lived caches can't grow forever
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._max_seen = max_seen
+        self._db_urls = None  # BloomFilter of DB URLs (any container supporting `in`)
+        self._last_loaded = 0  # URLs in the last filter load, to size the next one
+
+    async def load_from_db(
+        self,
+        source: Optional[str] = "hiring_cafe",
+        capacity: int = 2_000_000,
+        error_rate: float = 0.001,
+        known_ids: Optional[Set[str]] = None,
+    ):
+        """
+        Warm the Bloom filter with existing source_urls (all sources if None).
+
+        URLs are streamed from a server-side cursor in chunks and hashed in
+        a worker thread, so neither the full URL set nor the hashing loop
+        sits on the event loop. A `known_ids` set is filled from the same
+        pass (see Database.iter_source_urls).
 
-    async def load_from_db(self, source: str = "hiring_cafe"):
-        """Pre-load existing source_urls from the database."""
+        The filter is sized for at least 25% more URLs than the previous
+        load, so a growing table doesn't push it past `capacity`.
+        """
         if self.db and self._db_urls is None:
-            self._db_urls = await self.db.get_existing_source_urls(source)
-            logger.info(f"Loaded {len(self._db_urls)} existing URLs for dedup")
+            capacity = max(capacity, self._last_loaded * 5 // 4)
+            bloom = BloomFilter(capacity, error_rate)
+            async for urls in self.db.iter_source_urls(source, known_ids=known_ids):
+                await asyncio.to_thread(bloom.update, urls)
+            self._db_urls = bloom
+            self._last_loaded = len(bloom)
+            logger.info(f"Loaded {len(bloom)} existing URLs for dedup")
+            if len(bloom) > capacity:
+                logger.warning(
+                    f"Dedup filter holds {len(bloom)} URLs, over its capacity of "
+                    f"{capacity}; false positives exceed {error_rate:.2%} until "
+                    f"the next load resizes it"
+                )
 
     def is_duplicate(self, source_url: str) -> bool:
-        """Check if a URL has already been seen or exists in DB."""
+        """
+        Check if a URL has already been seen or (probably) exists in DB.
+
+        A DB hit may be a Bloom false positive; filter_new() confirms those.
+        """
         if not source_url:
             return False
 
         # Check batch cache
         if source_url in self._seen:
+            self._seen.move_to_end(source_url)
             return True
 
         # Check DB cache
@@ -44,10 +84,49 @@ class DeduplicationCache:
 
         return False
 
+    async def filter_new(self, jobs: List) -> List:
+        """
+        Return the jobs whose source_url is neither seen nor in the DB.
+
+        A Bloom-filter negative is definitive, so only URLs the filter
+        reports as present (or all URLs, when nothing is loaded) are
+        confirmed with a single `source_url = ANY($1)` query for the batch.
+        Jobs without a source_url are always kept. Kept URLs are marked as seen.
+        """
+        candidates = [
+            j for j in jobs
+            if not j.source_url or j.source_url not in self._seen
+        ]
+
+        maybe_known = self._db_urls
+        urls = list({
+            j.source_url for j in candidates
+            if j.source_url and (maybe_known is None or j.source_url in maybe_known)
+        })
+
+        existing: Set[str] = set()
+        if urls and self.db:
+            existing = await self.db.get_existing_urls(urls)
+        elif maybe_known is not None:
+            # No DB to confirm against — trust the filter
+            existing = set(urls)
+
+        new_jobs = []
+        for job in candidates:
+            url = job.source_url
+            if url and (url in existing or url in self._seen):
+                continue
+            self.mark_seen(url)
+            new_jobs.append(job)
+        return new_jobs
+
     def mark_seen(self, source_url: str):
-        """Mark a URL as seen in the current batch."""
+        """Mark a URL as seen, evicting the least recently used past max_seen."""
         if source_url:
-            self._seen.add(source_url)
+            self._seen[source_url] = None
+            self._seen.move_to_end(source_url)
+            if len(self._seen) > self._max_seen:
+                self._seen.popitem(last=False)
 
     def clear_batch(self):
         """Clear the current batch cache (keep DB cache)."""
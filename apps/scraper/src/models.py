@@ -4,13 +4,25 @@ models.py
 Pydantic V2 schemas aligned to the Drizzle `jobs` table.
 """
 
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
-import re
 import uuid
 
+import orjson
+
+from utils import format_vector
+
+# Column order for positional inserts (COPY / executemany) into `jobs`.
+JOB_COLUMNS: Tuple[str, ...] = (
+    "id", "title", "company_name", "description", "location",
+    "salary_min", "salary_max", "job_type", "remote", "source",
+    "source_url", "skills_required", "experience_required",
+    "posted_at", "expires_at", "is_active", "embedding",
+)
+
 
 class ScrapedJob(BaseModel):
     """
@@ -72,23 +84,49 @@ class ScrapedJob(BaseModel):
     @field_validator("skills_required", mode="before")
     @classmethod
     def ensure_list(cls, v) -> list[str]:
+        # dict.fromkeys drops repeats in one pass while keeping source order
         if v is None:
             return []
         if isinstance(v, str):
-            return [s.strip() for s in v.split(",") if s.strip()]
-        return list(v)
+            return list(dict.fromkeys(s for s in map(str.strip, v.split(",")) if s))
+        return list(dict.fromkeys(v))
 
     @field_validator("source_url", mode="before")
     @classmethod
     def validate_url(cls, v: Optional[str]) -> Optional[str]:
-        if v and not re.match(r"^https?://", v):
+        if v and not v.startswith(("http://", "https://")):
             return None
         return v
 
+    @classmethod
+    def from_trusted(cls, **data) -> "ScrapedJob":
+        """
+        Build a job from spider output without the validation pass.
+
+        Spiders already emit typed values (Decimal salaries, aware datetimes),
+        so only the cheap normalizations the validators perform are applied
+        here. Raises ValueError like the validated constructor would when
+        the required text fields are too short.
+        """
+        title = " ".join((data.get("title") or "").split())
+        company_name = " ".join((data.get("company_name") or "").split())
+        description = (data.get("description") or "").strip()
+        if len(title) < 3 or not company_name or len(description) < 10:
+            raise ValueError(f"Incomplete job data: {title!r} @ {company_name!r}")
+
+        data["title"] = title
+        data["company_name"] = company_name
+        data["description"] = description
+        for key in ("location", "job_type", "experience_required"):
+            value = data.get(key)
+            if isinstance(value, str):
+                data[key] = value.strip()
+        data["source_url"] = cls.validate_url(data.get("source_url"))
+        data["skills_required"] = cls.ensure_list(data.get("skills_required"))
+        return cls.model_construct(**data)
+
     def to_db_dict(self) -> dict:
         """Convert to dict matching Drizzle column names for INSERT."""
-        import json
-
         return {
             "id": self.id,
             "title": self.title,
@@ -101,7 +139,7 @@ class ScrapedJob(BaseModel):
             "remote": self.remote,
             "source": self.source,
             "source_url": self.source_url,
-            "skills_required": json.dumps(self.skills_required) if self.skills_required else None,
+            "skills_required": self._skills_json(),
             "experience_required": self.experience_required,
             "posted_at": self.posted_at,
             "expires_at": self.expires_at,
@@ -109,9 +147,45 @@ class ScrapedJob(BaseModel):
             "embedding": self.embedding,
         }
 
+    def to_db_tuple(self) -> tuple:
+        """
+        Convert to a positional record in JOB_COLUMNS order.
+
+        Feeds asyncpg's copy_records_to_table / executemany directly, skipping
+        the intermediate dict. The embedding is pre-formatted as a pgvector literal.
+        """
+        return (
+            self.id,
+            self.title,
+            self.company_name,
+            self.description,
+            self.location,
+            self.salary_min if self.salary_min else None,
+            self.salary_max if self.salary_max else None,
+            self.job_type,
+            self.remote,
+            self.source,
+            self.source_url,
+            self._skills_json(),
+            self.experience_required,
+            self.posted_at,
+            self.expires_at,
+            self.is_active,
+            format_vector(self.embedding),
+        )
+
+    def _skills_json(self) -> Optional[str]:
+        return orjson.dumps(self.skills_required).decode() if self.skills_required else None
+
+
+@dataclass(slots=True)
+class ScrapingMetrics:
+    """
+    Structured logging metrics for scraping operations.
 
-class ScrapingMetrics(BaseModel):
-    """Structured logging metrics for scraping operations."""
+    A plain slotted dataclass rather than a pydantic model: the counters
+    are bumped in per-batch loops and never need validation.
+    """
 
     source: str = "hiring_cafe"
     event: str = "metrics"
@@ -121,7 +195,7 @@ class ScrapingMetrics(BaseModel):
     duplicates_skipped: int = 0
     errors: int = 0
     duration_seconds: float = 0.0
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
     def to_log_dict(self) -> dict:
         return {
@@ -7,22 +7,42 @@ CHANGELOG:
 - Removed self._known_urls global state to prevent infinite RAM leak
 - Implemented scoped database existence checking per batch
 - Optimized embedding calls to only run for genuinely new jobs
+- Overlapped DB inserts of batch k with embedding of batches k+1..k+M
+- Dedup goes through DeduplicationCache.filter_new (in-batch + DB) before embedding
+- process() keeps its metrics local so concurrent calls don't clobber each other
+- Each cycle warms a Bloom filter of known URLs in front of the DB dedup query
+- Store stage hands to_db_tuple() records straight to the COPY insert
+- ScrapingMetrics is a slotted dataclass; counters are plain attribute bumps
+- Batch timing uses the monotonic perf_counter_ns clock
+- Embedding reads ScrapedJob attributes directly instead of building dicts
+- Disabled embeddings use a _NullEmbedder instead of a per-batch None check
+- reset_cycle() returns the known source IDs from the filter's warm-up pass
 """
 
 import asyncio
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
 from models import ScrapedJob, ScrapingMetrics
+from middlewares.deduplication import DeduplicationCache
 
 logger = logging.getLogger(__name__)
 
 
+class _NullEmbedder:
+    """Stand-in used when embeddings are disabled: embeds nothing."""
+
+    total_tokens_consumed = 0
+
+    async def embed_scraped_jobs(self, jobs: List[ScrapedJob]) -> List[None]:
+        return [None] * len(jobs)
+
+
 class JobProcessingPipeline:
     """
     Processes scraped jobs through:
-    1. Deduplication (by scoped DB check)
+    1. Deduplication (in-batch + scoped DB check)
     2. Embedding generation (Voyage AI)
     3. Batch insertion to DB
     """
@@ -32,53 +52,57 @@ class JobProcessingPipeline:
         database,
         embedding_service=None,
         batch_size: int = 25,
+        max_concurrent_embeds: int = 3,
     ):
         self.db = database
-        self.embedder = embedding_service
+        # Null object instead of None so _embed_batch needs no guard
+        self.embedder = embedding_service or _NullEmbedder()
         self.batch_size = batch_size
+        self.max_concurrent_embeds = max_concurrent_embeds
+        self.deduper = DeduplicationCache(database)
 
-        # Metrics
+        # Metrics of the most recent process() call
         self.metrics = ScrapingMetrics()
 
-    async def _embed_batch(self, jobs: List[ScrapedJob]) -> List[ScrapedJob]:
-        """Generate embeddings for a batch of jobs."""
-        if not self.embedder or not jobs:
-            return jobs
-
-        # Pass ALL fields for comprehensive embeddings
-        job_dicts = []
-        for job in jobs:
-            job_dicts.append({
-                "job_title": job.title,
-                "company_name": job.company_name,
-                "job_description": job.description[:3000],
-                "skills_required": job.skills_required or [],
-                "location": job.location or "",
-                "remote": job.remote,
-                "job_type": job.job_type or "",
-                "salary_min": float(job.salary_min) if job.salary_min else None,
-                "salary_max": float(job.salary_max) if job.salary_max else None,
-                "experience_required": job.experience_required or "",
-            })
+    async def reset_cycle(self) -> Set[str]:
+        """
+        Start a scrape cycle: forget last cycle's URLs and re-warm the
+        Bloom filter of known URLs (all sources) so filter negatives
+        skip the DB entirely.
 
+        Returns the known source IDs for the spiders' detail-fetch skip,
+        collected from the same pass over the table.
+        """
+        self.deduper.clear_all()
+        known_ids: Set[str] = set()
+        try:
+            await self.deduper.load_from_db(source=None, known_ids=known_ids)
+        except Exception as e:
+            # Without the filter every URL is simply checked against the DB,
+            # and spiders fetch details for whatever IDs weren't collected
+            logger.warning(f"Dedup filter warm-up failed: {e}")
+        return known_ids
+
+    async def _embed_batch(self, jobs: List[ScrapedJob]) -> int:
+        """Generate embeddings for a batch of jobs. Returns how many were embedded."""
+        embedded_count = 0
         try:
-            embedded = await self.embedder.embed_jobs(job_dicts)
+            embeddings = await self.embedder.embed_scraped_jobs(jobs)
 
-            for job, emb_dict in zip(jobs, embedded):
-                embedding = emb_dict.get("embedding")
+            for job, embedding in zip(jobs, embeddings):
                 if embedding:
                     job.embedding = embedding
-                    self.metrics.jobs_embedded += 1
+                    embedded_count += 1
 
         except Exception as e:
             logger.error(f"Embedding batch failed: {e}")
 
-        return jobs
+        return embedded_count
 
     async def _store_batch(self, jobs: List[ScrapedJob]) -> int:
-        """Insert a batch of jobs to DB."""
-        db_dicts = [job.to_db_dict() for job in jobs]
-        count = await self.db.insert_jobs_batch(db_dicts)
+        """Insert a batch of jobs to DB as positional COPY records."""
+        records = [job.to_db_tuple() for job in jobs]
+        count = await self.db.insert_job_records(records)
         return count
 
     async def process(self, jobs: List[ScrapedJob]) -> ScrapingMetrics:
@@ -88,47 +112,61 @@ class JobProcessingPipeline:
         NOTE on deduplication: We previously held `_known_urls` in memory, 
         which caused unbounded RAM growth over weeks. The new approach queries 
         `source_url = ANY($1)` scoping existence checks strictly to the current batch.
+        Repeats of a URL within the batch (or earlier in the cycle) are dropped
+        too, so nothing is embedded (and paid for) twice.
+
+        Safe to call concurrently — metrics are local to each call.
         """
-        start = time.time()
-        self.metrics = ScrapingMetrics()
-        self.metrics.jobs_found = len(jobs)
+        start_ns = time.perf_counter_ns()
+        metrics = ScrapingMetrics()
+        self.metrics = metrics
+        metrics.jobs_found = len(jobs)
+
+        # Step 1: Dedup — must run BEFORE embedding
+        unique_jobs = await self.deduper.filter_new(jobs)
 
-        # Step 1: Dedup
-        urls = [j.source_url for j in jobs if j.source_url]
-        existing_urls = await self.db.get_existing_urls(urls)
-        
-        unique_jobs = [j for j in jobs if j.source_url not in existing_urls]
-        
-        self.metrics.duplicates_skipped += len(jobs) - len(unique_jobs)
+        metrics.duplicates_skipped += len(jobs) - len(unique_jobs)
 
         logger.info({
             "event": "dedup_complete",
             "total": len(jobs),
             "unique": len(unique_jobs),
-            "duped": self.metrics.duplicates_skipped,
+            "duped": metrics.duplicates_skipped,
         })
 
         if not unique_jobs:
-            self.metrics.duration_seconds = time.time() - start
-            return self.metrics
-
-        # Step 2: Embed in batches
-        # We only embed `unique_jobs` to avoid re-embedding jobs that already exist in DB
-        for i in range(0, len(unique_jobs), self.batch_size):
-            batch = unique_jobs[i : i + self.batch_size]
-            await self._embed_batch(batch)
-
-        # Step 3: Store in batches
-        for i in range(0, len(unique_jobs), self.batch_size):
-            batch = unique_jobs[i : i + self.batch_size]
-            stored = await self._store_batch(batch)
-            self.metrics.jobs_stored += stored
+            metrics.duration_seconds = (time.perf_counter_ns() - start_ns) / 1e9
+            return metrics
+
+        # Step 2+3: Embed and store in batches, pipelined.
+        # We only embed `unique_jobs` to avoid re-embedding jobs that already exist in DB.
+        # Up to `max_concurrent_embeds` batches are in flight to Voyage while the
+        # store stage inserts finished batches in order.
+        batches = [
+            unique_jobs[i : i + self.batch_size]
+            for i in range(0, len(unique_jobs), self.batch_size)
+        ]
+        embed_slots = asyncio.Semaphore(self.max_concurrent_embeds)
+
+        async def embed(batch: List[ScrapedJob]) -> int:
+            async with embed_slots:
+                return await self._embed_batch(batch)
+
+        embed_tasks = [asyncio.create_task(embed(batch)) for batch in batches]
+        try:
+            for batch, embed_task in zip(batches, embed_tasks):
+                metrics.jobs_embedded += await embed_task
+                metrics.jobs_stored += await self._store_batch(batch)
+        finally:
+            for task in embed_tasks:
+                if not task.done():
+                    task.cancel()
 
-        self.metrics.duration_seconds = time.time() - start
+        metrics.duration_seconds = (time.perf_counter_ns() - start_ns) / 1e9
 
         logger.info({
             "event": "pipeline_complete",
-            **self.metrics.to_log_dict(),
+            **metrics.to_log_dict(),
         })
 
-        return self.metrics
+        return metrics
@@ -10,9 +10,11 @@ Endpoint: https://www.arbeitnow.com/api/job-board-api
 """
 
 import logging
-from datetime import datetime, timezone
+from concurrent.futures import Executor
 from typing import AsyncIterator, Optional, Set
 
+import aiohttp
+
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -25,6 +27,7 @@ from spiders.base import (
     extract_salary,
     detect_remote,
     detect_job_type,
+    parse_iso_datetime,
     safe_decimal,
 )
 
@@ -46,11 +49,22 @@ class ArbeitnowSpider(BaseSpider):
     BASE_URL = "https://www.arbeitnow.com/api/job-board-api"
     MAX_PAGES = 50  # Safety limit
 
-    def __init__(self, requests_per_minute: int = 20):
-        super().__init__(requests_per_minute=requests_per_minute)
+    def __init__(
+        self,
+        requests_per_minute: int = 20,
+        session: Optional[aiohttp.ClientSession] = None,
+        cpu_pool: Optional[Executor] = None,
+    ):
+        super().__init__(
+            requests_per_minute=requests_per_minute, session=session, cpu_pool=cpu_pool
+        )
+
+    def _parse_job(self, raw: dict, description: Optional[str] = None) -> Optional[ScrapedJob]:
+        """
+        Parse an Arbeitnow API job object into a ScrapedJob.
 
-    def _parse_job(self, raw: dict) -> Optional[ScrapedJob]:
-        """Parse an Arbeitnow API job object into a ScrapedJob."""
+        `description` is the already-converted plain text, if available.
+        """
         try:
             title = (raw.get("title") or "").strip()
             company = (raw.get("company_name") or "").strip()
@@ -59,8 +73,8 @@ class ArbeitnowSpider(BaseSpider):
                 return None
 
             # Description — HTML
-            desc_html = raw.get("description", "")
-            description = html_to_text(desc_html)
+            if description is None:
+                description = html_to_text(raw.get("description", ""))
             if len(description) < 10:
                 return None
 
@@ -101,23 +115,14 @@ class ArbeitnowSpider(BaseSpider):
             # YOE — extract from description
             yoe = extract_yoe(description)
 
-            # Posted date
-            posted_at = None
-            created_at_ts = raw.get("created_at")
-            if created_at_ts:
-                try:
-                    if isinstance(created_at_ts, (int, float)):
-                        posted_at = datetime.fromtimestamp(created_at_ts, tz=timezone.utc)
-                    elif isinstance(created_at_ts, str):
-                        posted_at = datetime.fromisoformat(created_at_ts.replace("Z", "+00:00"))
-                except (ValueError, OSError):
-                    pass
+            # Posted date — epoch seconds or ISO string
+            posted_at = parse_iso_datetime(raw.get("created_at"))
 
             # Generate a stable source_id for dedup  
             slug = raw.get("slug", "")
             requisition_id = slug or source_url
 
-            return ScrapedJob(
+            return ScrapedJob.from_trusted(
                 title=title,
                 company_name=company,
                 description=description,
@@ -175,6 +180,7 @@ class ArbeitnowSpider(BaseSpider):
                 consecutive_empty = 0
                 new_count = 0
 
+                new_raw = []
                 for raw_job in jobs_list:
                     slug = raw_job.get("slug", "")
                     url = raw_job.get("url", "") or raw_job.get("link", "")
@@ -185,8 +191,13 @@ class ArbeitnowSpider(BaseSpider):
                     known.add(dedup_key)
                     if url:
                         known.add(url)
+                    new_raw.append(raw_job)
 
-                    job = self._parse_job(raw_job)
+                descriptions = await self._html_to_text_many(
+                    [raw_job.get("description") or "" for raw_job in new_raw]
+                )
+                for raw_job, description in zip(new_raw, descriptions):
+                    job = self._parse_job(raw_job, description)
                     if job:
                         self.jobs_found += 1
                         new_count += 1
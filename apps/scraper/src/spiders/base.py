@@ -9,33 +9,66 @@ All spiders inherit from BaseSpider, which provides:
 - Salary range regex extraction from free text
 - Remote/onsite/hybrid detection
 - Job type detection (full-time, part-time, contract)
+- Timestamp parsing (ISO-8601 / epoch seconds)
 - Rate limiting
 - Metrics tracking
 """
 
 import asyncio
 import logging
+import os
 import re
-import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
 from html import unescape
-from typing import AsyncIterator, Optional, Set, Tuple, Any
+from typing import AsyncIterator, Callable, List, Optional, Set, Tuple, Any
 
 import aiohttp
+import orjson
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models import ScrapedJob
+from utils import TokenBucket
 
 logger = logging.getLogger(__name__)
 
+# ─── HTTP Session ─────────────────────────────────────────────────
+
+_DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept": "application/json",
+}
+
+
+def create_http_session(
+    connector: Optional[aiohttp.BaseConnector] = None,
+) -> aiohttp.ClientSession:
+    """
+    Build a ClientSession with the spider defaults.
+
+    Pass a shared connector to pool keep-alive connections and the DNS
+    cache across spiders; the session then owns that connector.
+    """
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=_DEFAULT_HEADERS,
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+
+
 # ─── HTML Cleaning ────────────────────────────────────────────────
 
-_BLOCK_TAG_RE = re.compile(r"</(p|div|h[1-6]|li|tr|br)>", re.I)
-_BR_TAG_RE = re.compile(r"<br\s*/?>", re.I)
+# <br> and block-closing tags both become newlines — one pass for the two
+_NEWLINE_TAG_RE = re.compile(r"<(?:br\s*/?|/(?:p|div|h[1-6]|li|tr|br))>", re.I)
 _ALL_TAGS_RE = re.compile(r"<[^>]+>")
 _MULTI_SPACE_RE = re.compile(r"[ \t]+")
 _MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
@@ -45,8 +78,7 @@ def html_to_text(html: str) -> str:
     """Convert HTML to plain text without external dependencies."""
     if not html:
         return ""
-    text = _BR_TAG_RE.sub("\n", html)
-    text = _BLOCK_TAG_RE.sub("\n", text)
+    text = _NEWLINE_TAG_RE.sub("\n", html)
     text = _ALL_TAGS_RE.sub(" ", text)
     text = unescape(text)
     text = _MULTI_SPACE_RE.sub(" ", text)
@@ -54,6 +86,43 @@ def html_to_text(html: str) -> str:
     return text.strip()
 
 
+def _html_to_text_batch(
+    htmls: List[str], convert: Callable[[str], str] = html_to_text
+) -> List[str]:
+    """Worker-side entry point: convert a chunk of HTML documents."""
+    return [convert(h) for h in htmls]
+
+
+# Below this many characters a batch is converted inline — pickling it to a
+# worker process would cost more than the regex passes themselves.
+_PROCESS_POOL_MIN_CHARS = 256_000
+
+
+async def html_to_text_many(
+    htmls: List[str],
+    pool: Optional[Executor] = None,
+    convert: Callable[[str], str] = html_to_text,
+) -> List[str]:
+    """
+    Convert many HTML descriptions to text, in order.
+
+    Large batches are split across `pool` so the regex passes run in
+    parallel and off the event loop; small ones (or all of them, without
+    a pool) run inline. `convert` must be a module-level function so it
+    can be pickled to worker processes.
+    """
+    if pool is None or sum(len(h) for h in htmls) < _PROCESS_POOL_MIN_CHARS:
+        return _html_to_text_batch(htmls, convert)
+
+    chunk = -(-len(htmls) // (os.cpu_count() or 1))
+    loop = asyncio.get_running_loop()
+    parts = await asyncio.gather(*(
+        loop.run_in_executor(pool, _html_to_text_batch, htmls[i:i + chunk], convert)
+        for i in range(0, len(htmls), chunk)
+    ))
+    return [text for part in parts for text in part]
+
+
 # ─── Field Extraction ─────────────────────────────────────────────
 
 # Matches patterns like: "3+ years", "5-7 years", "2 years of experience",
@@ -93,16 +162,24 @@ _REMOTE_KEYWORDS = {
     "work remotely", "anywhere", "distributed",
 }
 
-_ONSITE_KEYWORDS = {
-    "on-site", "onsite", "on site", "in-office", "in office",
-    "office-based", "office based",
-}
-
 _HYBRID_KEYWORDS = {
     "hybrid", "flex", "flexible location",
 }
 
 
+def _keyword_alternation(keywords) -> "re.Pattern[str]":
+    """Compile a keyword set into one case-insensitive alternation (longest first)."""
+    return re.compile(
+        "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)),
+        re.I,
+    )
+
+
+# One scan per set instead of one `in` check per keyword
+_REMOTE_RE = _keyword_alternation(_REMOTE_KEYWORDS)
+_HYBRID_RE = _keyword_alternation(_HYBRID_KEYWORDS)
+
+
 def extract_yoe(text: str) -> Optional[str]:
     """
     Extract years of experience from free text.
@@ -134,17 +211,16 @@ def extract_salary(text: str) -> Tuple[Optional[Decimal], Optional[Decimal]]:
         match = pattern.search(text)
         if match:
             groups = match.groups()
+            # Check once whether the match (plus a little trailing context)
+            # carries a 'k' thousands marker — it's the same for every group
+            has_k = "k" in text[match.start():match.end() + 5].lower()
             try:
                 values = []
                 for g in groups:
                     if g:
                         # Remove commas
-                        clean = g.replace(",", "")
-                        val = Decimal(clean)
-                        # Check if the original text had 'k' after this number
-                        pos = match.end()
-                        suffix = text[match.start():pos + 5].lower()
-                        if "k" in suffix and val < 1000:
+                        val = Decimal(g.replace(",", ""))
+                        if has_k and val < 1000:
                             val *= 1000
                         values.append(val)
 
@@ -172,13 +248,28 @@ def detect_remote(text: str, location: Optional[str] = None) -> bool:
     """
     Detect if a job is remote based on text content and location.
     """
-    combined = f"{text or ''} {location or ''}".lower()
-
-    for keyword in _REMOTE_KEYWORDS:
-        if keyword in combined:
-            return True
-
-    return False
+    # Case-insensitive search over each field — no joined/lowered copy
+    return bool(
+        (text and _REMOTE_RE.search(text))
+        or (location and _REMOTE_RE.search(location))
+    )
+
+
+# One alternation for every job-type marker. A single finditer pass
+# collects which groups occur; priority is applied afterwards, so the
+# result doesn't depend on where in the text each marker appears.
+_JOB_TYPE_RE = re.compile(
+    r"(?P<full_time>full-time|full time|fulltime)"
+    r"|(?P<part_time>part-time|part time|parttime)"
+    r"|(?P<contract>contract|freelance)"
+    r"|(?P<internship>\binternship\b)"
+    r"|(?P<intern>\bintern\b)"
+    r"|(?P<internal>\bintern(?:al|ation))"
+    r"|(?P<temporary>temporary|\btemp\b)",
+    re.I,
+)
+
+_JOB_TYPE_PRIORITY = ("full_time", "part_time", "contract", "internship", "temporary")
 
 
 def detect_job_type(text: str) -> Optional[str]:
@@ -190,44 +281,55 @@ def detect_job_type(text: str) -> Optional[str]:
     if not text:
         return None
 
-    lower = text.lower()
-
-    if "full-time" in lower or "full time" in lower or "fulltime" in lower:
-        return "full_time"
-    if "part-time" in lower or "part time" in lower or "parttime" in lower:
-        return "part_time"
-    if "contract" in lower or "freelance" in lower:
-        return "contract"
-    # Use regex word boundary to avoid 'international' / 'internal' matching
-    if re.search(r'\binternship\b', lower):
-        return "internship"
-    if re.search(r'\bintern\b', lower) and not re.search(r'\bintern(al|ation)', lower):
-        return "internship"
-    if "temporary" in lower or re.search(r'\btemp\b', lower):
-        return "temporary"
+    found = set()
+    for match in _JOB_TYPE_RE.finditer(text):  # re.I — no lowered copy
+        kind = match.lastgroup
+        if kind == "full_time":
+            return "full_time"  # Highest priority — no need to scan further
+        found.add(kind)
+
+    # A bare "intern" only counts when the text doesn't talk about
+    # "internal"/"international" anywhere
+    if "intern" in found and "internal" not in found:
+        found.add("internship")
+
+    for kind in _JOB_TYPE_PRIORITY:
+        if kind in found:
+            return kind
 
     return None
 
 
-def detect_workplace_type(text: str, location: Optional[str] = None) -> str:
+def parse_iso_datetime(value: Any) -> Optional[datetime]:
     """
-    Detect workplace type: 'remote', 'hybrid', or 'onsite'.
+    Parse an API timestamp: an ISO-8601 string (a trailing 'Z' is accepted
+    on every Python version) or Unix epoch seconds. Returns None when the
+    value is empty or can't be parsed.
     """
-    combined = f"{text or ''} {location or ''}".lower()
-
-    for keyword in _REMOTE_KEYWORDS:
-        if keyword in combined:
-            return "remote"
+    if not value:
+        return None
+    try:
+        if isinstance(value, str):
+            if value[-1] in "Zz":
+                value = value[:-1] + "+00:00"
+            return datetime.fromisoformat(value)
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value, tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        pass
+    return None
 
-    for keyword in _HYBRID_KEYWORDS:
-        if keyword in combined:
-            return "hybrid"
 
-    for keyword in _ONSITE_KEYWORDS:
-        if keyword in combined:
-            return "onsite"
+def detect_workplace_type(text: str, location: Optional[str] = None) -> str:
+    """
+    Detect workplace type: 'remote', 'hybrid', or 'onsite'.
+    """
+    if detect_remote(text, location):
+        return "remote"
+    if (text and _HYBRID_RE.search(text)) or (location and _HYBRID_RE.search(location)):
+        return "hybrid"
 
-    return "onsite"  # Default assumption
+    return "onsite"  # Explicit on-site wording or the default assumption
 
 
 # ─── Base Spider ──────────────────────────────────────────────────
@@ -246,10 +348,21 @@ class BaseSpider(ABC):
 
     SOURCE_NAME: str = "unknown"
 
-    def __init__(self, requests_per_minute: int = 20):
-        self._min_interval = 60.0 / requests_per_minute
-        self._last_request_at = 0.0
-        self._session: Optional[aiohttp.ClientSession] = None
+    def __init__(
+        self,
+        requests_per_minute: int = 20,
+        session: Optional[aiohttp.ClientSession] = None,
+        cpu_pool: Optional[Executor] = None,
+    ):
+        # Spiders may fetch concurrently; capacity 1 keeps the steady pacing
+        # (some sources, e.g. Remotive, cap requests per minute in their TOS)
+        self._rate_limiter = TokenBucket(rate=requests_per_minute, period=60.0)
+        # An injected session is shared and closed by its owner, not by us
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
+        # Process pool for CPU-bound HTML cleaning — owned by the orchestrator;
+        # without one, conversion runs inline
+        self._cpu_pool = cpu_pool
 
         # Metrics — reset between cycles by the orchestrator
         self.jobs_found = 0
@@ -257,27 +370,23 @@ class BaseSpider(ABC):
         self.errors = 0
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
-        """Lazily create an aiohttp session."""
+        """Lazily create an aiohttp session (unless one was injected)."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                headers={
-                    "User-Agent": (
-                        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/131.0.0.0 Safari/537.36"
-                    ),
-                    "Accept": "application/json",
-                },
-                timeout=aiohttp.ClientTimeout(total=30),
-            )
+            self._session = create_http_session()
+            self._owns_session = True
         return self._session
 
+    async def _html_to_text_many(self, htmls: List[str]) -> List[str]:
+        """Convert many HTML descriptions to text, in order, via the injected pool."""
+        try:
+            return await html_to_text_many(htmls, self._cpu_pool)
+        except Exception as e:
+            logger.warning(f"[{self.SOURCE_NAME}] HTML pool failed, converting inline: {e}")
+            return _html_to_text_batch(htmls)
+
     async def _throttle(self) -> None:
         """Enforce minimum interval between outbound requests."""
-        elapsed = time.monotonic() - self._last_request_at
-        if elapsed < self._min_interval:
-            await asyncio.sleep(self._min_interval - elapsed)
-        self._last_request_at = time.monotonic()
+        await self._rate_limiter.acquire()
 
     async def _get_json(self, url: str, params: dict = None) -> Optional[dict]:
         """GET a URL and return parsed JSON, with rate limiting and error handling."""
@@ -296,7 +405,7 @@ class BaseSpider(ABC):
                     logger.warning(f"[{self.SOURCE_NAME}] GET {url} returned {resp.status}")
                     return None
 
-                return await resp.json()
+                return orjson.loads(await resp.read())
 
         except asyncio.TimeoutError:
             logger.warning(f"[{self.SOURCE_NAME}] Timeout on {url}")
@@ -322,7 +431,9 @@ class BaseSpider(ABC):
         return jobs
 
     async def close(self) -> None:
-        """Close the aiohttp session."""
+        """Close the aiohttp session if this spider created it."""
+        if not self._owns_session:
+            return
         if self._session and not self._session.closed:
             await self._session.close()
             self._session = None
@@ -9,9 +9,12 @@ Endpoint: https://boards-api.greenhouse.io/v1/boards/{token}/jobs?content=true
 - Targets curated list of high-profile tech companies
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import AsyncIterator, Optional, Set, List
+from concurrent.futures import Executor
+from typing import AsyncIterator, Optional, Set, List, Tuple
+
+import aiohttp
 
 import sys
 from pathlib import Path
@@ -25,6 +28,7 @@ from spiders.base import (
     extract_salary,
     detect_remote,
     detect_job_type,
+    parse_iso_datetime,
     safe_decimal,
 )
 
@@ -84,17 +88,39 @@ class GreenhouseSpider(BaseSpider):
 
     SOURCE_NAME = "greenhouse"
     API_BASE = "https://boards-api.greenhouse.io/v1/boards"
+    MAX_CONCURRENT_BOARDS = 4  # Board downloads in flight (still throttled per request)
 
     def __init__(
         self,
         requests_per_minute: int = 30,
         company_boards: Optional[List[str]] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        cpu_pool: Optional[Executor] = None,
     ):
-        super().__init__(requests_per_minute=requests_per_minute)
+        super().__init__(
+            requests_per_minute=requests_per_minute, session=session, cpu_pool=cpu_pool
+        )
         self.boards = company_boards or COMPANY_BOARDS
 
-    def _parse_job(self, raw: dict, board_token: str) -> Optional[ScrapedJob]:
-        """Parse a Greenhouse API job object into a ScrapedJob."""
+    @staticmethod
+    def _company_name(board_token: str) -> str:
+        """Company name from the board token, capitalized."""
+        return board_token.replace("-", " ").replace("_", " ").title()
+
+    def _parse_job(
+        self,
+        raw: dict,
+        board_token: str,
+        description: Optional[str] = None,
+        requisition_id: Optional[str] = None,
+        company_name: Optional[str] = None,
+    ) -> Optional[ScrapedJob]:
+        """
+        Parse a Greenhouse API job object into a ScrapedJob.
+
+        `description`, `requisition_id` and `company_name` may be passed in
+        when the caller already computed them (per batch / per board).
+        """
         try:
             gh_id = raw.get("id")
             title = (raw.get("title") or "").strip()
@@ -103,13 +129,13 @@ class GreenhouseSpider(BaseSpider):
                 return None
 
             # Content — Greenhouse provides rich HTML content
-            content_html = raw.get("content", "")
-            description = html_to_text(content_html)
+            if description is None:
+                description = html_to_text(raw.get("content", ""))
             if len(description) < 10:
                 return None
 
-            # Company name — from the board token, capitalized
-            company_name = board_token.replace("-", " ").replace("_", " ").title()
+            if company_name is None:
+                company_name = self._company_name(board_token)
 
             # Location — from offices and location fields
             location_obj = raw.get("location", {}) or {}
@@ -132,10 +158,9 @@ class GreenhouseSpider(BaseSpider):
             if not source_url:
                 source_url = f"https://boards.greenhouse.io/{board_token}/jobs/{gh_id}"
 
-            # Salary — extract from content
-            salary_min, salary_max = extract_salary(description[:5000])
-
-            # Check metadata for compensation (some boards include it)
+            # Salary — structured compensation metadata first (some boards
+            # include it), then scan the content only for what's missing
+            salary_min, salary_max = None, None
             metadata = raw.get("metadata", []) or []
             for meta in metadata:
                 if meta.get("name", "").lower() in ("compensation", "salary", "pay"):
@@ -147,6 +172,11 @@ class GreenhouseSpider(BaseSpider):
                         if s_max:
                             salary_max = s_max
 
+            if not (salary_min and salary_max):
+                d_min, d_max = extract_salary(description[:5000])
+                salary_min = salary_min or d_min
+                salary_max = salary_max or d_max
+
             # YOE — extract from content
             yoe = extract_yoe(description)
 
@@ -154,17 +184,11 @@ class GreenhouseSpider(BaseSpider):
             job_type = detect_job_type(description[:2000])
 
             # Posted date
-            posted_at = None
-            updated_at_str = raw.get("updated_at") or raw.get("first_published_at")
-            if updated_at_str:
-                try:
-                    posted_at = datetime.fromisoformat(
-                        updated_at_str.replace("Z", "+00:00")
-                    )
-                except (ValueError, AttributeError):
-                    pass
+            posted_at = parse_iso_datetime(
+                raw.get("updated_at") or raw.get("first_published_at")
+            )
 
-            return ScrapedJob(
+            return ScrapedJob.from_trusted(
                 title=title,
                 company_name=company_name,
                 description=description,
@@ -179,7 +203,7 @@ class GreenhouseSpider(BaseSpider):
                 experience_required=yoe,
                 posted_at=posted_at,
                 is_active=True,
-                requisition_id=f"gh-{board_token}-{gh_id}",
+                requisition_id=requisition_id or f"gh-{board_token}-{gh_id}",
             )
 
         except Exception as e:
@@ -187,12 +211,21 @@ class GreenhouseSpider(BaseSpider):
             self.errors += 1
             return None
 
+    async def _fetch_board(self, board_token: str) -> Optional[dict]:
+        """Download a board's job list (with content) from the boards API."""
+        url = f"{self.API_BASE}/{board_token}/jobs"
+        return await self._get_json(url, params={"content": "true"})
+
     async def _scrape_board(
-        self, board_token: str, known: Set[str]
+        self, board_token: str, known: Set[str], data: Optional[dict] = None
     ) -> AsyncIterator[ScrapedJob]:
-        """Scrape all jobs from a single Greenhouse board."""
-        url = f"{self.API_BASE}/{board_token}/jobs"
-        data = await self._get_json(url, params={"content": "true"})
+        """
+        Scrape all jobs from a single Greenhouse board.
+
+        `data` is the already-downloaded board payload, if available.
+        """
+        if data is None:
+            data = await self._fetch_board(board_token)
 
         if not data:
             return
@@ -204,6 +237,8 @@ class GreenhouseSpider(BaseSpider):
         self.pages_scraped += 1
         new_count = 0
 
+        new_raw = []
+        new_keys = []
         for raw_job in jobs_list:
             gh_id = raw_job.get("id")
             dedup_key = f"gh-{board_token}-{gh_id}"
@@ -211,8 +246,15 @@ class GreenhouseSpider(BaseSpider):
             if dedup_key in known:
                 continue
             known.add(dedup_key)
-
-            job = self._parse_job(raw_job, board_token)
+            new_raw.append(raw_job)
+            new_keys.append(dedup_key)
+
+        company_name = self._company_name(board_token)
+        descriptions = await self._html_to_text_many(
+            [raw_job.get("content") or "" for raw_job in new_raw]
+        )
+        for raw_job, description, dedup_key in zip(new_raw, descriptions, new_keys):
+            job = self._parse_job(raw_job, board_token, description, dedup_key, company_name)
             if job:
                 self.jobs_found += 1
                 new_count += 1
@@ -234,10 +276,21 @@ class GreenhouseSpider(BaseSpider):
             "boards": len(self.boards),
         })
 
+        # Boards are independent, so download several at once and parse
+        # each one as soon as it arrives. The rate limit still applies to
+        # every request; this only overlaps the (large) response bodies.
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT_BOARDS)
+
+        async def fetch(board_token: str) -> Tuple[str, Optional[dict]]:
+            async with sem:
+                return board_token, await self._fetch_board(board_token)
+
+        tasks = [asyncio.create_task(fetch(board)) for board in self.boards]
         try:
-            for board_token in self.boards:
+            for next_done in asyncio.as_completed(tasks):
+                board_token, data = await next_done
                 try:
-                    async for job in self._scrape_board(board_token, known):
+                    async for job in self._scrape_board(board_token, known, data):
                         yield job
                 except Exception as e:
                     logger.warning(f"[greenhouse] Board '{board_token}' failed: {e}")
@@ -247,6 +300,9 @@ class GreenhouseSpider(BaseSpider):
             logger.error(f"[greenhouse] Scrape failed: {e}", exc_info=True)
             self.errors += 1
         finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
             await self.close()
 
         logger.info({
@@ -8,16 +8,35 @@ CHANGELOG:
 - Added pagination circuit breaker to prevent infinite loops on stale API offsets
 - Skipping detail fetches automatically if job ID is in known_ids
 - Migrated to Playwright and playwright-stealth to autonomously run JS and defeat Cloudflare Turnstile blocks, reusing cf_clearance cookies.
+- Probes the API over plain aiohttp first; Chromium only launches when Cloudflare challenges
+- Browser skips images/fonts/media during clearance (scripts and CSS still load for Turnstile)
+- Turnstile selectors hoisted to the class; each clearance poll probes them with one combined locator
+- API responses decoded with orjson from the raw body on both transports
+- Request pacing uses the shared TokenBucket (loop clock, safe under concurrent fetches)
+- Next search page is prefetched while the current page's jobs are parsed and yielded
+- Direct session uses a tuned TCPConnector (DNS cache, 75s keep-alive) for the single API host
+- _parse_job resolves field fallbacks through class-level key tuples instead of inline .get() chains
+- Cycle duration timed on the monotonic perf_counter_ns clock
+- Detail fetches for a page run concurrently (bounded by detail_concurrency) instead of one at a time
+- _html_to_text turns <br> and block-closing tags into newlines in a single regex pass
+- _html_to_text skips tag/entity passes for plain-text input and binds its regexes as locals
+- Salary strings → Decimal conversions memoized (lru_cache)
+- A page's descriptions are converted in one batch, on the shared process pool when large
+- With a known total_count, up to search_concurrency search pages are fetched ahead in parallel
+- The direct-session probe's total count is reused instead of requested again
+- Description conversion falls back to inline when the process pool fails
 """
 
 import asyncio
 import logging
 import re
-import time
 import random
+import time
+from collections import deque
 from decimal import Decimal, InvalidOperation
-from typing import AsyncIterator, Optional, Dict, Any, List, Set, Tuple
-from datetime import datetime, timezone
+from concurrent.futures import Executor
+from typing import AsyncIterator, Deque, Optional, Dict, Any, List, Set, Tuple
+from functools import lru_cache
 from html import unescape
 
 import json
@@ -25,6 +44,8 @@ import os
 import sys
 from pathlib import Path
 
+import aiohttp
+import orjson
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -38,44 +59,88 @@ from playwright_stealth import Stealth
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from models import ScrapedJob
+from spiders.base import _html_to_text_batch, create_http_session, html_to_text_many
+from utils import TokenBucket
 
 logger = logging.getLogger(__name__)
 
 # ─── Helpers ──────────────────────────────────────────────────────
 
-_BLOCK_TAG_RE = re.compile(r"</(p|div|h[1-6]|li|tr)>", re.I)
-_BR_TAG_RE = re.compile(r"<br\s*/?>", re.I)
+# Transient failures worth retrying, whichever transport is in use
+_RETRYABLE = (PlaywrightError, asyncio.TimeoutError, aiohttp.ClientError)
+
+# <br> and block-closing tags both become newlines — one pass for the two
+_NEWLINE_TAG_RE = re.compile(r"<(?:br\s*/?|/(?:p|div|h[1-6]|li|tr))>", re.I)
 _ALL_TAGS_RE = re.compile(r"<[^>]+>")
 _MULTI_SPACE_RE = re.compile(r"[ \t]+")
 _MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
 
 
-def _html_to_text(html: str) -> str:
+def _html_to_text(
+    html: str,
+    # Bound at definition time so the per-call lookups are locals
+    _newline_tags=_NEWLINE_TAG_RE.sub,
+    _all_tags=_ALL_TAGS_RE.sub,
+    _unescape=unescape,
+    _spaces=_MULTI_SPACE_RE.sub,
+    _newlines=_MULTI_NEWLINE_RE.sub,
+) -> str:
     """Convert HTML to plain text without external dependencies."""
     if not html:
         return ""
-    text = _BR_TAG_RE.sub("\n", html)
-    text = _BLOCK_TAG_RE.sub("\n", text)
-    text = _ALL_TAGS_RE.sub(" ", text)
-    text = unescape(text)
-    text = _MULTI_SPACE_RE.sub(" ", text)
-    text = _MULTI_NEWLINE_RE.sub("\n\n", text)
+    text = html
+    # Already-plain text (e.g. description_clean) skips the tag and entity
+    # passes; whitespace is still normalized so both paths agree
+    if "<" in text:
+        text = _all_tags(" ", _newline_tags("\n", text))
+    if "&" in text:
+        text = _unescape(text)
+    text = _spaces(" ", text)
+    text = _newlines("\n\n", text)
     return text.strip()
 
 
+@lru_cache(maxsize=4096)
+def _decimal_from_str(value: str) -> Optional[Decimal]:
+    # Salaries repeat heavily across postings (100000, 120000, ...), and
+    # Decimal is immutable, so cached instances are safe to share
+    try:
+        return Decimal(value)
+    except (InvalidOperation, ValueError):
+        return None
+
+
 def _safe_decimal(value: Any) -> Optional[Decimal]:
     """Safely convert a value to Decimal, returning None on failure."""
     if value is None:
         return None
-    try:
-        return Decimal(str(value))
-    except (InvalidOperation, ValueError, TypeError):
-        return None
+    return _decimal_from_str(str(value))
+
+
+def _first(data: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    """Value of the first key in `keys` that is set (truthy) in `data`, else None."""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
 
 
 # ─── Spider ───────────────────────────────────────────────────────
 
 
+class _Response:
+    """Transport-neutral result of a GET: status, headers and the decoded body."""
+
+    __slots__ = ("status", "headers", "data", "text")
+
+    def __init__(self, status: int, headers: Any, data: Any = None, text: str = ""):
+        self.status = status
+        self.headers = headers
+        self.data = data  # Parsed JSON, or None if not requested/parseable
+        self.text = text  # Raw body when JSON wasn't requested or failed to parse
+
+
 class HiringCafeSpider:
     """
     Production spider for hiring.cafe using Playwright.
@@ -83,6 +148,7 @@ class HiringCafeSpider:
     Features:
     - Autonomously bypasses Cloudflare JS Challenges using a stealth Chromium instance
     - Reuses clearance cookies for raw headless HTTP fetches avoiding constant popups
+    - Skips the browser entirely when the API answers plain aiohttp requests
     - GET /api/search-jobs for paginated search (returns full job records)
     - GET /api/search-jobs/get-total-count for total count
     - GET /_next/data/{buildId}/viewjob/{id}.json for extra detail (optional)
@@ -95,18 +161,54 @@ class HiringCafeSpider:
     SEARCH_URL = "https://hiring.cafe/api/search-jobs"
     COUNT_URL = "https://hiring.cafe/api/search-jobs/get-total-count"
 
+    # Resource types the clearance page never needs. Scripts, stylesheets and
+    # XHR stay — Turnstile needs them to render and report its result.
+    _BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "texttrack"})
+
+    # Turnstile widget selectors, most specific first
+    _TURNSTILE_SELECTORS = (
+        "#AOzYg6",  # Primary Turnstile container found by investigation
+        "iframe[src*='challenges.cloudflare.com']",
+        "iframe[src*='challenge-platform']",
+        "iframe[title*='Cloudflare']",
+        "iframe[id*='cf-chl-widget']",
+        "#cf-turnstile",
+        ".cf-turnstile",
+    )
+    _TURNSTILE_ANY = ", ".join(_TURNSTILE_SELECTORS)
+
+    # Fallback key chains — search cards and detail JSON name fields differently
+    _TITLE_KEYS = ("title", "job_title", "job_title_raw")
+    _ID_KEYS = ("requisition_id", "requisitionId", "id", "objectID")
+    _COMPANY_DATA_KEYS = ("enriched_company_data", "company_data")
+    _COMPANY_NAME_KEYS = ("company_name", "company")
+    _DESCRIPTION_KEYS = ("description", "job_description_html", "job_description")
+    _PLAIN_DESCRIPTION_KEYS = ("description_clean", "job_description_text")
+    _V5_KEYS = ("v5_processed_job_data", "processed_data")
+
     _BUILD_ID_RE = re.compile(r'"buildId"\s*:\s*"([^"]+)"')
+    # Reads just the buildId from the already-loaded page instead of
+    # re-downloading and regex-scanning the whole homepage
+    _BUILD_ID_JS = "() => (window.__NEXT_DATA__ && window.__NEXT_DATA__.buildId) || null"
 
     def __init__(
         self,
         requests_per_minute: int = 20,
         page_size: int = 50,
         max_pages: int = 500,
+        detail_concurrency: Optional[int] = None,
+        search_concurrency: int = 4,
+        cpu_pool: Optional[Executor] = None,
     ):
-        self._min_interval = 60.0 / requests_per_minute
+        # Steady pacing with no burst: hiring.cafe sits behind Cloudflare
+        self._rate_limiter = TokenBucket(rate=requests_per_minute, period=60.0)
         self._page_size = page_size
         self._max_pages = max_pages
-        self._last_request_at = 0.0
+        # Detail fetches kept in flight at once; the rate limiter still paces
+        # their starts, this only lets their latencies overlap
+        self._detail_concurrency = detail_concurrency or max(1, min(8, requests_per_minute // 10))
+        self._search_concurrency = max(1, search_concurrency)  # Pages in flight once total is known
+        self._cpu_pool = cpu_pool  # Optional executor for batched HTML → text
 
         self._build_id: Optional[str] = None
         
@@ -115,8 +217,10 @@ class HiringCafeSpider:
         self._session_path = self._abs_root / ".sessions/hiring_cafe"
         self._cookies_file = self._session_path / "cookies.json"
         
-        # Injected runtime via scrape() execution loop
+        # Injected runtime via scrape() execution loop — either the cleared
+        # browser page or, when no challenge is served, a plain HTTP session
         self._page: Optional[Page] = None
+        self._session: Optional[aiohttp.ClientSession] = None
 
         # Metrics — reset between cycles by the orchestrator
         self.jobs_found = 0
@@ -125,8 +229,8 @@ class HiringCafeSpider:
         self.errors = 0
 
     async def close(self) -> None:
-        """Compatibility signature."""
-        pass
+        """Close the direct HTTP session, if one is open."""
+        await self._close_direct_session()
 
     # ─── Cloudflare Clearance & Session ───────────────────────────
 
@@ -163,7 +267,15 @@ class HiringCafeSpider:
             
             await asyncio.sleep(random.uniform(0.1, 0.5))
         except Exception as e:
-            logger.debug(f"Behavior simulation partial failure: {e}")
+            logger.debug("Behavior simulation partial failure: %s", e)
+
+    @classmethod
+    async def _route_block_heavy(cls, route) -> None:
+        """Playwright route handler: abort non-essential resource types."""
+        if route.request.resource_type in cls._BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def _save_session(self, context) -> None:
         """Save cookies to the session file."""
@@ -197,16 +309,6 @@ class HiringCafeSpider:
         start_time = asyncio.get_event_loop().time()
         timeout_sec = timeout_ms / 1000.0
         
-        TURNSTILE_SELECTORS = [
-            "#AOzYg6", # Primary Turnstile container found by investigation
-            "iframe[src*='challenges.cloudflare.com']",
-            "iframe[src*='challenge-platform']",
-            "iframe[title*='Cloudflare']",
-            "iframe[id*='cf-chl-widget']",
-            "#cf-turnstile",
-            ".cf-turnstile",
-        ]
-
         logger.info(f"Executing behavioral simulation and waiting for challenge to settle ({timeout_sec}s)...")
 
         while (asyncio.get_event_loop().time() - start_time) < timeout_sec:
@@ -222,15 +324,22 @@ class HiringCafeSpider:
             # 3. Check: Page title cleared
             try:
                 title = await page.title()
-                if "just a moment" not in title.lower() and "attention required" not in title.lower():
+                title_lower = title.lower()
+                if "just a moment" not in title_lower and "attention required" not in title_lower:
                     logger.info(f"✅ Challenge passed based on title: {title}")
                     return True
             except Exception:
                 pass
 
             # 4. Check: Turnstile Challenge (Advanced Frame Search)
+            # One combined probe per poll; the per-selector walk below only
+            # runs once some widget is actually on the page
             solved_this_loop = False
-            for selector in TURNSTILE_SELECTORS:
+            try:
+                widget_present = await page.locator(self._TURNSTILE_ANY).count() > 0
+            except Exception:
+                widget_present = True
+            for selector in (self._TURNSTILE_SELECTORS if widget_present else ()):
                 try:
                     locator = page.locator(selector).first
                     if await locator.count() > 0:
@@ -274,7 +383,7 @@ class HiringCafeSpider:
             await page.screenshot(path=str(diag_path))
             logger.warning(f"❌ Clearance timed out. Screenshot saved to {diag_path}")
         except Exception as e:
-            logger.debug(f"Failed to capture diagnostic screenshot: {e}")
+            logger.debug("Failed to capture diagnostic screenshot: %s", e)
             
         return False
 
@@ -372,6 +481,10 @@ class HiringCafeSpider:
         except Exception as e:
             logger.warning(f"playwright-stealth partial failure (continuing): {e}")
 
+        # Don't download images/fonts/media for the challenge page. Routes
+        # only apply to page traffic, not to the page.request API calls.
+        await context.route("**/*", self._route_block_heavy)
+
         # Try restoring existing session cookies
         await self._load_session(context)
 
@@ -393,28 +506,114 @@ class HiringCafeSpider:
         ua = await page.evaluate("navigator.userAgent")
         return None, context, page, ua
 
+    # ─── Transport ────────────────────────────────────────────────
+
+    async def _open_direct_session(self) -> Optional[int]:
+        """
+        Probe the count API with plain aiohttp. When it answers with JSON
+        (no Cloudflare challenge) the whole cycle runs over HTTP, Chromium
+        is never launched, and the decoded total count is returned so it
+        isn't requested again. Returns None when the browser is needed.
+        """
+        if self._session is None or self._session.closed:
+            # Single API host: keep its connections alive between the
+            # throttled requests and resolve DNS once per cycle
+            self._session = create_http_session(
+                aiohttp.TCPConnector(
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True,
+                )
+            )
+        try:
+            resp = await self._request(self.COUNT_URL)
+            if resp.status == 200 and resp.data is not None:
+                total = self._parse_total(resp.data)
+                logger.info({"event": "total_count", "total": total})
+                return total
+            logger.info(f"[hiring_cafe] Direct probe returned {resp.status} — using browser")
+        except Exception as e:
+            logger.info(f"[hiring_cafe] Direct probe failed ({e}) — using browser")
+        await self._close_direct_session()
+        return None
+
+    async def _close_direct_session(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request(self, url: str, as_json: bool = True) -> "_Response":
+        """
+        GET a URL through the active transport: the cleared browser page
+        when there is one, otherwise the direct aiohttp session.
+        """
+        if self._page is not None:
+            resp = await self._page.request.get(url)
+            status, headers = resp.status, resp.headers
+            if status != 200:
+                return _Response(status, headers)
+            return self._decode(status, headers, await resp.body(), as_json)
+
+        async with self._session.get(url) as resp:
+            status, headers = resp.status, resp.headers
+            if status != 200:
+                return _Response(status, headers)
+            return self._decode(status, headers, await resp.read(), as_json)
+
+    @staticmethod
+    def _decode(status: int, headers: Any, body: bytes, as_json: bool) -> "_Response":
+        """Parse a 200 body with orjson, falling back to text (e.g. a CF challenge page)."""
+        if as_json:
+            try:
+                return _Response(status, headers, data=orjson.loads(body))
+            except orjson.JSONDecodeError:
+                pass
+        return _Response(status, headers, text=body.decode("utf-8", errors="ignore"))
+
+    # ─── HTML Conversion ──────────────────────────────────────────
+
+    async def _html_to_text_many(self, htmls: List[str]) -> List[str]:
+        """Convert a page's descriptions to text, in order, via the injected pool."""
+        try:
+            return await html_to_text_many(htmls, self._cpu_pool, _html_to_text)
+        except Exception as e:
+            # A broken or shut-down pool shouldn't cost the whole source
+            logger.warning(f"[hiring_cafe] HTML pool failed, converting inline: {e}")
+            return _html_to_text_batch(htmls, _html_to_text)
+
     # ─── Rate Limiting ────────────────────────────────────────────
 
     async def _throttle(self) -> None:
         """Enforce minimum interval between outbound API requests."""
-        elapsed = time.monotonic() - self._last_request_at
-        if elapsed < self._min_interval:
-            await asyncio.sleep(self._min_interval - elapsed)
-        self._last_request_at = time.monotonic()
+        await self._rate_limiter.acquire()
 
     # ─── Build ID ─────────────────────────────────────────────────
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=2, min=5, max=60),
-        retry=retry_if_exception_type((PlaywrightError, asyncio.TimeoutError)),
+        retry=retry_if_exception_type(_RETRYABLE),
     )
     async def _discover_build_id(self) -> str:
-        """Fetch the homepage and extract the Next.js buildId."""
+        """
+        Get the Next.js buildId: read from the cleared page when the browser
+        is in use, otherwise fetch the homepage and extract it.
+        """
+        if self._page is not None:
+            try:
+                build_id = await self._page.evaluate(self._BUILD_ID_JS)
+            except Exception as e:
+                logger.debug("buildId evaluate failed: %s", e)
+                build_id = None
+            if build_id:
+                logger.info({"event": "build_id_discovered", "build_id": build_id})
+                return build_id
+
         await self._throttle()
         logger.info(f"Fetching homepage for buildId using authorized session...")
 
-        resp = await self._page.request.get(self.BASE)
+        resp = await self._request(self.BASE, as_json=False)
         status = resp.status
         logger.info(f"Homepage response: {status}")
 
@@ -426,8 +625,7 @@ class HiringCafeSpider:
         if status != 200:
             raise PlaywrightError(f"Homepage returned {status}")
 
-        body_bytes = await resp.body()
-        html = body_bytes.decode('utf-8', errors='ignore')
+        html = resp.text
 
         match = self._BUILD_ID_RE.search(html)
         if not match:
@@ -452,16 +650,16 @@ class HiringCafeSpider:
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=2, min=3, max=120),
-        retry=retry_if_exception_type((PlaywrightError, asyncio.TimeoutError)),
+        retry=retry_if_exception_type(_RETRYABLE),
     )
     async def _search_page(self, offset: int) -> Dict[str, Any]:
         """GET /api/search-jobs — returns JSON directly."""
         await self._throttle()
 
         url = f"{self.SEARCH_URL}?offset={offset}&limit={self._page_size}"
-        logger.debug(f"Searching offset {offset}...")
+        logger.debug("Searching offset %d...", offset)
 
-        resp = await self._page.request.get(url)
+        resp = await self._request(url)
         status = resp.status
 
         if status == 429:
@@ -481,30 +679,20 @@ class HiringCafeSpider:
             logger.error({"event": "search_error", "status": status})
             raise PlaywrightError(f"Search returned {status}")
 
-        try:
-            data = await resp.json()
-        except Exception as e:
-            body_bytes = await resp.body()
-            text = body_bytes.decode('utf-8', errors='ignore')
-            logger.error(f"Failed to parse search JSON. Body preview: {text[:300]}")
-            raise PlaywrightError(f"Invalid JSON from search API: {e}")
+        if resp.data is None:
+            logger.error(f"Failed to parse search JSON. Body preview: {resp.text[:300]}")
+            raise PlaywrightError("Invalid JSON from search API")
 
-        return data
+        return resp.data
 
     async def _get_total_count(self) -> int:
         """GET /api/search-jobs/get-total-count → total available jobs."""
         await self._throttle()
 
         try:
-            resp = await self._page.request.get(self.COUNT_URL)
+            resp = await self._request(self.COUNT_URL)
             if resp.status == 200:
-                data = await resp.json()
-                if isinstance(data, int):
-                    total = data
-                elif isinstance(data, dict):
-                    total = data.get("total", data.get("count", 0))
-                else:
-                    total = 0
+                total = self._parse_total(resp.data)
                 logger.info({"event": "total_count", "total": total})
                 return total
             else:
@@ -513,12 +701,21 @@ class HiringCafeSpider:
             logger.warning(f"Could not get total count: {exc}")
         return 0
 
+    @staticmethod
+    def _parse_total(data: Any) -> int:
+        """Decode the count API body: a bare int or {"total"|"count": n}."""
+        if isinstance(data, int):
+            return data
+        if isinstance(data, dict):
+            return data.get("total", data.get("count", 0))
+        return 0
+
     # ─── Job Detail (optional — needs buildId) ────────────────────
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=retry_if_exception_type((PlaywrightError, asyncio.TimeoutError)),
+        retry=retry_if_exception_type(_RETRYABLE),
     )
     async def _fetch_job_detail(self, requisition_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -532,19 +729,18 @@ class HiringCafeSpider:
 
         url = f"{self.BASE}/_next/data/{self._build_id}/viewjob/{requisition_id}.json"
 
-        resp = await self._page.request.get(url)
+        resp = await self._request(url)
         status = resp.status
         
         if status == 200:
             self.detail_fetches += 1
-            try:
-                data = await resp.json()
-                return data.get("pageProps", data)
-            except Exception:
+            data = resp.data
+            if not isinstance(data, dict):
                 return None
+            return data.get("pageProps", data)
 
         if status == 404:
-            logger.debug(f"Detail 404 for {requisition_id} — buildId may be stale")
+            logger.debug("Detail 404 for %s — buildId may be stale", requisition_id)
             return None
 
         if status == 429:
@@ -556,9 +752,40 @@ class HiringCafeSpider:
             await asyncio.sleep(30)
             raise PlaywrightError("Rate limited / blocked on detail")
 
-        logger.debug(f"Detail {status} for {requisition_id}")
+        logger.debug("Detail %s for %s", status, requisition_id)
         return None
 
+    async def _fetch_details(self, req_ids: List[str]) -> AsyncIterator[ScrapedJob]:
+        """
+        Fetch and parse detail pages with up to `detail_concurrency` requests
+        in flight, yielding jobs as they complete (not in input order).
+        """
+        if not req_ids:
+            return
+        sem = asyncio.Semaphore(self._detail_concurrency)
+
+        async def fetch_and_parse(req_id: str) -> Optional[ScrapedJob]:
+            async with sem:
+                try:
+                    detail = await self._fetch_job_detail(req_id)
+                except Exception as exc:
+                    logger.debug("Detail fetch failed for %s: %s", req_id, exc)
+                    self.errors += 1
+                    return None
+            return self._parse_job(detail) if detail else None
+
+        tasks = [asyncio.create_task(fetch_and_parse(req_id)) for req_id in req_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                job = await next_done
+                if job:
+                    yield job
+        finally:
+            # Consumer stopped early — don't leave fetches running
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     # ─── Parsing ──────────────────────────────────────────────────
 
     @staticmethod
@@ -566,69 +793,63 @@ class HiringCafeSpider:
         """Extract requisition_id from a search result card."""
         return card.get("requisition_id") or card.get("objectID")
 
-    def _parse_job(self, raw: Dict[str, Any]) -> Optional[ScrapedJob]:
+    @staticmethod
+    def _flatten_record(raw: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Unwrap pageProps and lift nested job / job_information fields to the
+        top level. Idempotent, so already-flattened records pass through.
+        """
+        data = raw.get("pageProps", raw) if "pageProps" in raw else raw
+
+        for key in ["job", "job_information"]:
+            nested = data.get(key)
+            if isinstance(nested, dict):
+                merged = data.copy()
+                merged.update(nested)
+                data = merged
+        return data
+
+    def _parse_job(
+        self, raw: Dict[str, Any], description: Optional[str] = None
+    ) -> Optional[ScrapedJob]:
         """
         Parse raw job data into ScrapedJob.
         Handles both search result cards and detail page JSON.
+        `description` is the already-converted text when the caller batched
+        the HTML conversion; otherwise it is converted here.
         """
         try:
             if not raw:
                 return None
 
-            data = raw.get("pageProps", raw) if "pageProps" in raw else raw
+            data = self._flatten_record(raw)
 
-            for key in ["job", "job_information"]:
-                nested = data.get(key)
-                if isinstance(nested, dict):
-                    merged = data.copy()
-                    merged.update(nested)
-                    data = merged
-
-            title = (
-                data.get("title")
-                or data.get("job_title")
-                or data.get("job_title_raw")
-                or ""
-            )
-            requisition_id = (
-                data.get("requisition_id")
-                or data.get("requisitionId")
-                or data.get("id")
-                or data.get("objectID")
-                or ""
-            )
+            title = _first(data, self._TITLE_KEYS)
+            requisition_id = _first(data, self._ID_KEYS)
 
             if not title or not requisition_id:
-                logger.debug(f"Parsing failed: missing title or id. keys: {list(data.keys())}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Parsing failed: missing title or id. keys: %s", list(data.keys()))
                 return None
 
-            company_data = (
-                data.get("enriched_company_data")
-                or data.get("company_data")
-                or {}
-            )
+            company_data = _first(data, self._COMPANY_DATA_KEYS) or {}
             company_name = (
                 company_data.get("name")
-                or data.get("company_name")
-                or data.get("company")
+                or _first(data, self._COMPANY_NAME_KEYS)
                 or "Unknown"
             )
 
-            description_html = (
-                data.get("description")
-                or data.get("job_description_html")
-                or data.get("job_description", "")
-            )
-            description = _html_to_text(description_html)
+            if description is None:
+                description = _html_to_text(_first(data, self._DESCRIPTION_KEYS))
 
             if len(description) < 10:
-                description = data.get("description_clean") or data.get("job_description_text") or description
+                description = _first(data, self._PLAIN_DESCRIPTION_KEYS) or description
 
             if len(description) < 10:
-                logger.debug(f"Description too short for {requisition_id}. Content: {description[:50]}")
+                logger.debug("Description too short for %s. Content: %.50s", requisition_id, description)
                 return None
 
-            v5 = data.get("v5_processed_job_data") or data.get("processed_data") or {}
+            v5 = _first(data, self._V5_KEYS) or {}
 
             salary_min = _safe_decimal(v5.get("yearly_min_compensation") or data.get("yearly_min_compensation"))
             salary_max = _safe_decimal(v5.get("yearly_max_compensation") or data.get("yearly_max_compensation"))
@@ -654,7 +875,7 @@ class HiringCafeSpider:
                 or f"{self.BASE}/viewjob/{requisition_id}"
             )
 
-            job = ScrapedJob(
+            job = ScrapedJob.from_trusted(
                 title=title,
                 company_name=company_name,
                 description=description,
@@ -698,10 +919,20 @@ class HiringCafeSpider:
         still provide jobs even if hiring.cafe is fully blocked.
         """
         known = known_ids or set()
-        start_time = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
         logger.info({"event": "scrape_start", "source": "hiring_cafe"})
 
         try:
+            total = await self._open_direct_session()
+            if total is not None:
+                logger.info("[hiring_cafe] API reachable without a challenge — skipping the browser")
+                try:
+                    async for job in self._run_scrape_loop(known, start_ns, total=total):
+                        yield job
+                finally:
+                    await self._close_direct_session()
+                return
+
             async with async_playwright() as pw:
                 try:
                     browser_obj, context, self._page, ua = await self._get_clearance(pw)
@@ -714,7 +945,7 @@ class HiringCafeSpider:
                     return
 
                 try:
-                    async for job in self._run_scrape_loop(known, start_time, total=None):
+                    async for job in self._run_scrape_loop(known, start_ns, total=None):
                         yield job
                 finally:
                     if browser_obj:
@@ -728,11 +959,12 @@ class HiringCafeSpider:
             )
             self.errors += 1
 
-    async def _run_scrape_loop(self, known: Set[str], start_time: datetime, total: Optional[int]) -> AsyncIterator[ScrapedJob]:
-        """Isolates the central loop iteration."""
+    async def _run_scrape_loop(self, known: Set[str], start_ns: int, total: Optional[int]) -> AsyncIterator[ScrapedJob]:
+        """Isolates the central loop iteration. `total` is fetched when not already known."""
         
         await self._ensure_build_id()
-        total = await self._get_total_count()
+        if total is None:
+            total = await self._get_total_count()
 
         offset = 0
         page_num = 0
@@ -740,75 +972,112 @@ class HiringCafeSpider:
         seen_ids: Set[str] = set()
         duplicate_streak: int = 0
 
-        while page_num < self._max_pages:
-            try:
-                page_data = await self._search_page(offset)
-            except Exception as exc:
-                logger.error({
-                    "event": "search_page_error",
-                    "offset": offset,
-                    "error": str(exc),
-                })
-                self.errors += 1
-                break
-
-            hits = page_data.get("results") or page_data.get("hits") or []
-
-            if not hits:
-                logger.info({"event": "pagination_complete", "pages": page_num})
-                break
-            
-            page_ids = {self._extract_requisition_id(c) for c in hits if self._extract_requisition_id(c)}
-            
-            if page_ids and page_ids.issubset(seen_ids):
-                duplicate_streak += 1
-                if duplicate_streak >= 2:
-                    logger.warning(f"Pagination loop detected, stopping early at offset {offset}")
+        # Upcoming search pages are requested while the current one is parsed
+        # and consumed, so their fetches overlap the downstream work. With a
+        # known total the last page is known too, so several pages can be in
+        # flight without overshooting; otherwise only the next one is.
+        # Pages are still consumed strictly in offset order.
+        window = self._search_concurrency if total else 1
+        pending: Deque[asyncio.Task] = deque()
+        scheduled_offset = 0
+        scheduled_pages = 0
+
+        def schedule_pages() -> None:
+            nonlocal scheduled_offset, scheduled_pages
+            while (
+                len(pending) < window
+                and scheduled_pages < self._max_pages
+                and not (total and scheduled_offset >= total)
+            ):
+                pending.append(asyncio.create_task(self._search_page(scheduled_offset)))
+                scheduled_offset += self._page_size
+                scheduled_pages += 1
+
+        schedule_pages()
+        try:
+            while pending:
+                try:
+                    page_data = await pending.popleft()
+                except Exception as exc:
+                    logger.error({
+                        "event": "search_page_error",
+                        "offset": offset,
+                        "error": str(exc),
+                    })
+                    self.errors += 1
                     break
-            else:
-                duplicate_streak = 0
-            
-            seen_ids.update(page_ids)
 
-            new_on_page = 0
-            for card in hits:
-                req_id = self._extract_requisition_id(card)
-                if not req_id or req_id in known:
-                    continue
+                hits = page_data.get("results") or page_data.get("hits") or []
 
-                known.add(req_id)
+                if not hits:
+                    logger.info({"event": "pagination_complete", "pages": page_num})
+                    break
 
-                job = self._parse_job(card)
+                # Resolve each card's id once; reused for loop detection and dedup
+                id_cards = [(self._extract_requisition_id(card), card) for card in hits]
+                page_ids = {req_id for req_id, _ in id_cards if req_id}
 
-                if not job and self._build_id:
-                    try:
-                        detail = await self._fetch_job_detail(req_id)
-                        if detail:
-                            job = self._parse_job(detail)
-                    except Exception as exc:
-                        logger.debug(f"Detail fetch failed for {req_id}: {exc}")
-                        self.errors += 1
+                if page_ids and page_ids.issubset(seen_ids):
+                    duplicate_streak += 1
+                    if duplicate_streak >= 2:
+                        logger.warning(f"Pagination loop detected, stopping early at offset {offset}")
+                        break
+                else:
+                    duplicate_streak = 0
+
+                seen_ids.update(page_ids)
+
+                schedule_pages()
+
+                new_cards: List[Tuple[str, Dict[str, Any]]] = []
+                for req_id, card in id_cards:
+                    if req_id and req_id not in known:
+                        known.add(req_id)
+                        new_cards.append((req_id, self._flatten_record(card)))
+
+                # The page's descriptions are converted in one batch — across
+                # the process pool when large — instead of per job on the loop
+                descriptions = await self._html_to_text_many(
+                    [_first(data, self._DESCRIPTION_KEYS) or "" for _, data in new_cards]
+                )
+
+                new_on_page = 0
+                needs_detail: List[str] = []
+                for (req_id, data), description in zip(new_cards, descriptions):
+                    job = self._parse_job(data, description)
+                    if job:
+                        self.jobs_found += 1
+                        new_on_page += 1
+                        yield job
+                    elif self._build_id:
+                        needs_detail.append(req_id)
 
-                if job:
+                # Cards too sparse to parse are completed from the detail API
+                async for job in self._fetch_details(needs_detail):
                     self.jobs_found += 1
                     new_on_page += 1
                     yield job
 
-            if new_on_page > 0:
-                logger.info(f"Page {page_num + 1}: found {new_on_page} new jobs")
+                if new_on_page > 0:
+                    logger.info(f"Page {page_num + 1}: found {new_on_page} new jobs")
 
-            self.pages_scraped += 1
-            page_num += 1
-            offset += self._page_size
+                self.pages_scraped += 1
+                page_num += 1
+                offset += self._page_size
 
-            if page_num % 5 == 0:
-                logger.info(f"Progress: {page_num}/{self._max_pages} pages. Total found: {self.jobs_found}")
+                if page_num % 5 == 0:
+                    logger.info(f"Progress: {page_num}/{self._max_pages} pages. Total found: {self.jobs_found}")
 
-            if total and offset >= total:
-                logger.info(f"Reached total {total} jobs")
-                break
+                if total and offset >= total:
+                    logger.info(f"Reached total {total} jobs")
+                    break
+        finally:
+            # Early exit (loop detected, consumer stopped) — drop the prefetches
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-        duration = (datetime.now(timezone.utc) - start_time).total_seconds()
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
         logger.info({
             "event": "scrape_complete",
             "source": "hiring_cafe",
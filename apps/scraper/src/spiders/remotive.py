@@ -11,9 +11,11 @@ Endpoint: https://remotive.com/api/remote-jobs
 
 import logging
 import re
-from datetime import datetime, timezone
+from concurrent.futures import Executor
 from typing import AsyncIterator, Optional, Set
 
+import aiohttp
+
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -25,6 +27,7 @@ from spiders.base import (
     extract_yoe,
     extract_salary,
     detect_job_type,
+    parse_iso_datetime,
     safe_decimal,
 )
 
@@ -62,12 +65,23 @@ class RemotiveSpider(BaseSpider):
     SOURCE_NAME = "remotive"
     BASE_URL = "https://remotive.com/api/remote-jobs"
 
-    def __init__(self, requests_per_minute: int = 2):
+    def __init__(
+        self,
+        requests_per_minute: int = 2,
+        session: Optional[aiohttp.ClientSession] = None,
+        cpu_pool: Optional[Executor] = None,
+    ):
         # Remotive TOS: max 2 req/min, max 4 fetches/day
-        super().__init__(requests_per_minute=requests_per_minute)
+        super().__init__(
+            requests_per_minute=requests_per_minute, session=session, cpu_pool=cpu_pool
+        )
+
+    def _parse_job(self, raw: dict, description: Optional[str] = None) -> Optional[ScrapedJob]:
+        """
+        Parse a Remotive API job object into a ScrapedJob.
 
-    def _parse_job(self, raw: dict) -> Optional[ScrapedJob]:
-        """Parse a Remotive API job object into a ScrapedJob."""
+        `description` is the already-converted plain text, if available.
+        """
         try:
             job_id = raw.get("id")
             title = raw.get("title", "").strip()
@@ -77,8 +91,8 @@ class RemotiveSpider(BaseSpider):
                 return None
 
             # Description
-            desc_html = raw.get("description", "")
-            description = html_to_text(desc_html)
+            if description is None:
+                description = html_to_text(raw.get("description", ""))
             if len(description) < 10:
                 return None
 
@@ -112,20 +126,14 @@ class RemotiveSpider(BaseSpider):
             # Category/tags as skills
             category = raw.get("category", "")
             tags = raw.get("tags", []) or []
-            skills = [t for t in tags if t] if isinstance(tags, list) else []
-            if category and category not in skills:
-                skills.insert(0, category)
+            # Category leads; repeats are dropped (order kept) by ScrapedJob
+            skills = [category, *tags] if isinstance(tags, list) else [category]
+            skills = [s for s in skills if s]
 
             # Posted date
-            posted_at = None
-            pub_date = raw.get("publication_date")
-            if pub_date:
-                try:
-                    posted_at = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    pass
-
-            return ScrapedJob(
+            posted_at = parse_iso_datetime(raw.get("publication_date"))
+
+            return ScrapedJob.from_trusted(
                 title=title,
                 company_name=company,
                 description=description,
@@ -153,16 +161,17 @@ class RemotiveSpider(BaseSpider):
         """Normalize Remotive job_type strings."""
         if not raw:
             return None
-        lower = raw.lower().replace("_", " ").replace("-", " ")
-        if "full" in lower:
+        lower = raw.lower()
+        words = lower.replace("_", " ").replace("-", " ")
+        if "full" in words:
             return "full_time"
-        if "part" in lower:
+        if "part" in words:
             return "part_time"
-        if "contract" in lower or "freelance" in lower:
+        if "contract" in words or "freelance" in words:
             return "contract"
-        if "intern" in lower:
+        if "intern" in words:
             return "internship"
-        return raw.lower().replace(" ", "_")
+        return lower.replace(" ", "_")
 
     async def scrape(
         self, known_ids: Optional[Set[str]] = None
@@ -185,12 +194,13 @@ class RemotiveSpider(BaseSpider):
 
                 jobs_list = data.get("jobs", [])
                 if not jobs_list:
-                    logger.debug(f"[remotive] No jobs in category: {category}")
+                    logger.debug("[remotive] No jobs in category: %s", category)
                     continue
 
                 self.pages_scraped += 1
                 new_count = 0
 
+                new_raw = []
                 for raw_job in jobs_list:
                     job_id = str(raw_job.get("id", ""))
                     url = raw_job.get("url", "")
@@ -201,8 +211,13 @@ class RemotiveSpider(BaseSpider):
 
                     known.add(url)
                     known.add(job_id)
+                    new_raw.append(raw_job)
 
-                    job = self._parse_job(raw_job)
+                descriptions = await self._html_to_text_many(
+                    [raw_job.get("description") or "" for raw_job in new_raw]
+                )
+                for raw_job, description in zip(new_raw, descriptions):
+                    job = self._parse_job(raw_job, description)
                     if job:
                         self.jobs_found += 1
                         new_count += 1
@@ -3,7 +3,10 @@
 utils.py
 Shared utilities for the scraper application.
 """
-from typing import List, Optional
+import asyncio
+import hashlib
+import math
+from typing import Iterable, List, Optional
 
 def format_vector(embedding: Optional[List[float]]) -> Optional[str]:
     """
@@ -12,4 +15,95 @@ def format_vector(embedding: Optional[List[float]]) -> Optional[str]:
     """
     if not embedding:
         return None
-    return '[' + ','.join(str(v) for v in embedding) + ']'
\ No newline at end of file
+    return '[' + ','.join(str(v) for v in embedding) + ']'
+
+
+class BloomFilter:
+    """
+    Compact probabilistic set of strings.
+
+    Never reports a false negative; false positives occur at roughly
+    `error_rate`. Costs ~1.8 bytes per entry at 0.1% instead of a full
+    Python string plus hash-table slot.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(1, capacity)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self._num_bits = num_bits
+        self._num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+        self._count = 0
+
+    @classmethod
+    def from_iterable(cls, items: Iterable[str], capacity: int,
+                      error_rate: float = 0.001) -> "BloomFilter":
+        bloom = cls(capacity, error_rate)
+        bloom.update(items)
+        return bloom
+
+    def _positions(self, item: str) -> List[int]:
+        # Kirsch–Mitzenmacher double hashing over one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        m = self._num_bits
+        return [(h1 + i * h2) % m for i in range(self._num_hashes)]
+
+    def add(self, item: str):
+        bits = self._bits
+        for pos in self._positions(item):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self._count += 1
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter: `rate` acquisitions per `period`
+    seconds, with bursts of up to `capacity`.
+
+    Waiters are served in FIFO order under a lock, so concurrent callers
+    can't all slip through on the same refill. Uses the loop's monotonic
+    clock. Usable as `await bucket.acquire()` or `async with bucket:`.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0, capacity: float = 1.0):
+        self._per_second = rate / period
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0):
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is not None:
+                    self._tokens = min(
+                        self._capacity,
+                        self._tokens + (now - self._updated) * self._per_second,
+                    )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self._per_second)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
@@ -40,6 +40,18 @@ from middlewares.deduplication import DeduplicationCache
 # ═══════════════════════════════════════════════════════════════════
 
 
+def _make_job(**overrides) -> ScrapedJob:
+    """Build a valid ScrapedJob, overriding only the fields a test cares about."""
+    fields = {
+        "title": "Dev",
+        "company_name": "Corp",
+        "description": "Z " * 30,
+        "source": "remotive",
+    }
+    fields.update(overrides)
+    return ScrapedJob(**fields)
+
+
 @pytest.fixture
 def sample_job_info() -> Dict[str, Any]:
     """Realistic job_information payload as returned by hiring.cafe."""
@@ -131,6 +143,10 @@ class TestHtmlToText:
         result = _html_to_text("<p>   lots   of   spaces   </p>")
         assert "  " not in result
 
+    def test_plain_text_still_normalized(self):
+        assert _html_to_text("  a   b\n\n\n\nc  ") == "a b\n\nc"
+        assert _html_to_text("a &lt;b&gt; c") == "a <b> c"
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  SAFE DECIMAL
@@ -206,6 +222,16 @@ class TestScrapedJob:
         )
         assert job.skills_required == ["Python", "Go"]
 
+    def test_skills_deduplicated_in_order(self):
+        job = ScrapedJob.from_trusted(
+            title="Backend Dev",
+            company_name="Corp",
+            description="Y " * 30,
+            source="remotive",
+            skills_required=["Go", "Python", "Go", "Rust", "Python"],
+        )
+        assert job.skills_required == ["Go", "Python", "Rust"]
+
     def test_skills_none(self):
         job = ScrapedJob(
             title="Backend Dev",
@@ -306,6 +332,61 @@ class TestScrapedJob:
         d = job.to_db_dict()
         assert "meta" not in d
 
+    def test_to_db_tuple_matches_columns(self):
+        from models import JOB_COLUMNS
+
+        job = _make_job(
+            source="greenhouse",
+            skills_required=["Python"],
+            salary_min=Decimal("100000"),
+            embedding=[0.5, 0.25],
+        )
+        row = dict(zip(JOB_COLUMNS, job.to_db_tuple()))
+
+        assert len(job.to_db_tuple()) == len(JOB_COLUMNS)
+        assert row["id"] == job.id
+        assert row["source"] == "greenhouse"
+        assert row["salary_min"] == Decimal("100000")
+        assert row["salary_max"] is None
+        assert json.loads(row["skills_required"]) == ["Python"]
+        assert row["embedding"] == "[0.5,0.25]"
+
+        d = job.to_db_dict()
+        assert tuple(d) == JOB_COLUMNS
+        assert [d[c] for c in JOB_COLUMNS if c not in ("salary_min", "embedding")] == [
+            row[c] for c in JOB_COLUMNS if c not in ("salary_min", "embedding")
+        ]
+
+    def test_from_trusted_matches_validated(self):
+        data = dict(
+            title="  Senior   Engineer ",
+            company_name=" Corp ",
+            description="Z " * 30,
+            source="remotive",
+            source_url="ftp://bad.example.com",
+            skills_required="Python, Go",
+            salary_min=Decimal("90000"),
+        )
+        trusted = ScrapedJob.from_trusted(**data)
+        validated = ScrapedJob(**data)
+
+        assert trusted.title == validated.title == "Senior Engineer"
+        assert trusted.company_name == validated.company_name == "Corp"
+        assert trusted.source_url is None
+        assert trusted.skills_required == ["Python", "Go"]
+        assert trusted.id
+        trusted_row = trusted.to_db_dict()
+        validated_row = validated.to_db_dict()
+        trusted_row.pop("id")
+        validated_row.pop("id")
+        assert trusted_row == validated_row
+
+    def test_from_trusted_rejects_short_fields(self):
+        with pytest.raises(ValueError):
+            ScrapedJob.from_trusted(
+                title="QA", company_name="Corp", description="Z " * 30, source="remotive"
+            )
+
     def test_requisition_id_required(self):
         with pytest.raises(Exception):
             ScrapedJob(
@@ -382,6 +463,14 @@ class TestSpiderParsing:
         assert job.experience_required is None
         assert job.remote is False
 
+    def test_parse_flattened_record_with_converted_description(self, spider, sample_job_info):
+        data = spider._flatten_record(sample_job_info)
+        assert spider._flatten_record(data) == data
+
+        job = spider._parse_job(data, "Already converted description text.")
+        assert job.title == "Senior Backend Engineer"
+        assert job.description == "Already converted description text."
+
     def test_parse_missing_title(self, spider):
         raw = {"pageProps": {"job_information": {"requisition_id": "x"}}}
         assert spider._parse_job(raw) is None
@@ -512,6 +601,46 @@ class TestSpiderBuildId:
         match = spider._BUILD_ID_RE.search(html)
         assert match is None
 
+    @pytest.mark.asyncio
+    async def test_build_id_read_from_loaded_page(self, spider):
+        page = MagicMock()
+        page.evaluate = AsyncMock(return_value="EwAUde_27rGDUUZJk9NkP")
+        page.request.get = AsyncMock()
+        spider._page = page
+
+        assert await spider._discover_build_id() == "EwAUde_27rGDUUZJk9NkP"
+        page.request.get.assert_not_awaited()
+
+
+class TestSpiderBrowser:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("resource_type,aborted", [
+        ("image", True), ("font", True), ("script", False), ("stylesheet", False),
+    ])
+    async def test_route_blocks_heavy_resources(self, spider, resource_type, aborted):
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.abort = AsyncMock()
+        route.continue_ = AsyncMock()
+
+        await spider._route_block_heavy(route)
+
+        assert route.abort.await_count == int(aborted)
+        assert route.continue_.await_count == int(not aborted)
+
+    @pytest.mark.asyncio
+    async def test_clearance_poll_probes_turnstile_once(self, spider):
+        page = MagicMock()
+        page.context.cookies = AsyncMock(side_effect=[[], [{"name": "cf_clearance"}]])
+        page.title = AsyncMock(return_value="Just a moment...")
+        page.locator.return_value.count = AsyncMock(return_value=0)
+        spider._simulate_human_behavior = AsyncMock()
+
+        with patch("spiders.hiring_cafe.asyncio.sleep", new=AsyncMock()):
+            assert await spider._wait_for_clearance(page, timeout_ms=60000) is True
+
+        page.locator.assert_called_once_with(spider._TURNSTILE_ANY)
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  SPIDER — METRICS
@@ -539,11 +668,140 @@ class TestSpiderMetrics:
         assert m["errors"] == 2
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  API SPIDERS (base session handling)
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestBaseSpider:
+    @pytest.mark.asyncio
+    async def test_injected_session_is_not_closed(self):
+        from spiders.remotive import RemotiveSpider
+
+        session = MagicMock()
+        session.closed = False
+        session.close = AsyncMock()
+        spider = RemotiveSpider(session=session)
+
+        assert await spider._ensure_session() is session
+        await spider.close()
+        session.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_owned_session_is_closed(self):
+        from spiders.remotive import RemotiveSpider
+
+        spider = RemotiveSpider()
+        session = await spider._ensure_session()
+        await spider.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_html_to_text_many_keeps_order(self):
+        from spiders.remotive import RemotiveSpider
+
+        spider = RemotiveSpider()
+        texts = await spider._html_to_text_many(["<p>One</p>", "", "<b>Two</b>"])
+        assert texts == ["One", "", "Two"]
+
+    @pytest.mark.asyncio
+    async def test_html_to_text_many_uses_injected_pool(self):
+        from concurrent.futures import ThreadPoolExecutor
+        from spiders.remotive import RemotiveSpider
+
+        htmls = [f"<p>{i}{'x' * 100_000}</p>" for i in range(4)]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pool.submit = MagicMock(wraps=pool.submit)
+            spider = RemotiveSpider(cpu_pool=pool)
+            texts = await spider._html_to_text_many(htmls)
+
+        assert pool.submit.called
+        assert [t[:1] for t in texts] == ["0", "1", "2", "3"]
+
+
+class TestFieldExtraction:
+    def test_detect_job_type_priority(self):
+        from spiders.base import detect_job_type
+
+        assert detect_job_type("Contract role, full-time hours") == "full_time"
+        assert detect_job_type("Part Time or freelance") == "part_time"
+        assert detect_job_type("Temp contract") == "contract"
+        assert detect_job_type("Summer Internship") == "internship"
+        assert detect_job_type("Nothing to see here") is None
+
+    def test_detect_job_type_intern_word_boundaries(self):
+        from spiders.base import detect_job_type
+
+        assert detect_job_type("Hiring an intern") == "internship"
+        assert detect_job_type("International team") is None
+        assert detect_job_type("Intern for our internal tools") is None
+        assert detect_job_type("Temp intern, international") == "temporary"
+
+    def test_detect_remote_and_workplace_type(self):
+        from spiders.base import detect_remote, detect_workplace_type
+
+        assert detect_remote("Senior Engineer", "Anywhere")
+        assert detect_remote("Work From Home possible")
+        assert not detect_remote("Berlin office", None)
+        assert detect_workplace_type("Hybrid, 2 days in office") == "hybrid"
+        assert detect_workplace_type("Fully remote") == "remote"
+        assert detect_workplace_type("On-site in Munich") == "onsite"
+
+    def test_parse_iso_datetime(self):
+        from spiders.base import parse_iso_datetime
+
+        utc = timezone.utc
+        assert parse_iso_datetime("2024-01-15T10:30:00Z") == datetime(2024, 1, 15, 10, 30, tzinfo=utc)
+        assert parse_iso_datetime("2024-01-15T10:30:00") == datetime(2024, 1, 15, 10, 30)
+        assert parse_iso_datetime(1705314600) == datetime(2024, 1, 15, 10, 30, tzinfo=utc)
+        assert parse_iso_datetime("not a date") is None
+        assert parse_iso_datetime(None) is None
+
+    def test_greenhouse_prefers_metadata_compensation(self):
+        from spiders.greenhouse import GreenhouseSpider
+
+        spider = GreenhouseSpider(company_boards=["acme"])
+        raw = {
+            "id": 42,
+            "title": "Platform Engineer",
+            "metadata": [{"name": "Compensation", "value": "$150,000 - $190,000"}],
+        }
+
+        job = spider._parse_job(raw, "acme", "Great role. Budget was $90k - $100k last year.")
+        assert (job.salary_min, job.salary_max) == (Decimal("150000"), Decimal("190000"))
+
+        raw["metadata"] = []
+        job = spider._parse_job(raw, "acme", "Great role. Budget is $90k - $100k.")
+        assert (job.salary_min, job.salary_max) == (Decimal("90000"), Decimal("100000"))
+
+    @pytest.mark.asyncio
+    async def test_greenhouse_boards_download_concurrently(self):
+        from spiders.greenhouse import GreenhouseSpider
+
+        spider = GreenhouseSpider(company_boards=["slow", "fast"])
+        delays = {"slow": 0.05, "fast": 0.0}
+
+        async def fetch_board(board):
+            await asyncio.sleep(delays[board])
+            return {"jobs": [{"id": 1, "title": f"Engineer {board}",
+                              "content": "<p>A long enough description</p>"}]}
+
+        spider._fetch_board = fetch_board
+        titles = [job.title async for job in spider.scrape()]
+        assert titles == ["Engineer fast", "Engineer slow"]
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  DEDUPLICATION CACHE
 # ═══════════════════════════════════════════════════════════════════
 
 
+async def _async_chunks(chunks):
+    """Async generator standing in for Database.iter_source_urls."""
+    for chunk in chunks:
+        yield chunk
+
+
 class TestDeduplicationCache:
     def test_empty_not_duplicate(self):
         cache = DeduplicationCache()
@@ -566,6 +824,17 @@ class TestDeduplicationCache:
         cache.clear_batch()
         assert cache.is_duplicate(url) is False
 
+    def test_seen_is_bounded_lru(self):
+        cache = DeduplicationCache(max_seen=2)
+        cache.mark_seen("https://a.com/1")
+        cache.mark_seen("https://a.com/2")
+        assert cache.is_duplicate("https://a.com/1") is True  # refreshes 1
+        cache.mark_seen("https://a.com/3")  # evicts 2
+
+        assert cache.is_duplicate("https://a.com/1") is True
+        assert cache.is_duplicate("https://a.com/2") is False
+        assert cache.is_duplicate("https://a.com/3") is True
+
     def test_clear_all(self):
         cache = DeduplicationCache()
         cache._db_urls = {"https://db.com/job/1"}
@@ -586,16 +855,280 @@ class TestDeduplicationCache:
     @pytest.mark.asyncio
     async def test_load_from_db(self):
         mock_db = AsyncMock()
-        mock_db.get_existing_source_urls.return_value = {
-            "https://hiring.cafe/viewjob/existing1",
-        }
+        mock_db.iter_source_urls = MagicMock(
+            return_value=_async_chunks([["https://hiring.cafe/viewjob/existing1"]])
+        )
         cache = DeduplicationCache(database=mock_db)
 
         await cache.load_from_db("hiring_cafe")
 
         assert cache._db_urls is not None
         assert cache.is_duplicate("https://hiring.cafe/viewjob/existing1") is True
-        mock_db.get_existing_source_urls.assert_awaited_once_with("hiring_cafe")
+        mock_db.iter_source_urls.assert_called_once_with("hiring_cafe", known_ids=None)
+
+    @pytest.mark.asyncio
+    async def test_filter_new_single_round_trip(self):
+        mock_db = AsyncMock()
+        mock_db.get_existing_urls.return_value = {"https://example.com/old"}
+        cache = DeduplicationCache(database=mock_db)
+
+        jobs = [
+            _make_job(title=f"Job {suffix}", source_url=f"https://example.com/{suffix}")
+            for suffix in ("old", "new", "new")
+        ]
+
+        new_jobs = await cache.filter_new(jobs)
+
+        assert [j.source_url for j in new_jobs] == ["https://example.com/new"]
+        mock_db.get_existing_urls.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_filter_new_bloom_negative_skips_db(self):
+        mock_db = AsyncMock()
+        mock_db.iter_source_urls = MagicMock(
+            return_value=_async_chunks([["https://example.com/old"]])
+        )
+        mock_db.get_existing_urls.return_value = {"https://example.com/old"}
+        cache = DeduplicationCache(database=mock_db)
+        await cache.load_from_db("remotive")
+
+        jobs = [
+            _make_job(title=f"Job {suffix}", source_url=f"https://example.com/{suffix}")
+            for suffix in ("old", "new")
+        ]
+
+        new_jobs = await cache.filter_new(jobs)
+
+        assert [j.source_url for j in new_jobs] == ["https://example.com/new"]
+        # Only the Bloom positive is confirmed against the DB
+        mock_db.get_existing_urls.assert_awaited_once_with(["https://example.com/old"])
+
+
+class TestBloomFilter:
+    def test_no_false_negatives(self):
+        from utils import BloomFilter
+
+        urls = [f"https://example.com/job/{i}" for i in range(5000)]
+        bloom = BloomFilter.from_iterable(urls, capacity=len(urls))
+        assert all(u in bloom for u in urls)
+        assert len(bloom) == 5000
+
+    def test_false_positive_rate(self):
+        from utils import BloomFilter
+
+        bloom = BloomFilter.from_iterable(
+            (f"https://a.com/{i}" for i in range(5000)), capacity=5000, error_rate=0.01
+        )
+        false_hits = sum(f"https://b.com/{i}" in bloom for i in range(5000))
+        assert false_hits < 150
+
+
+class TestTokenBucket:
+    @pytest.mark.asyncio
+    async def test_spaces_out_concurrent_acquires(self):
+        from utils import TokenBucket
+
+        bucket = TokenBucket(rate=20, period=1.0)  # one token every 50 ms
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        assert loop.time() - start >= 0.09
+
+    @pytest.mark.asyncio
+    async def test_burst_up_to_capacity(self):
+        from utils import TokenBucket
+
+        bucket = TokenBucket(rate=1, period=60.0, capacity=3)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(3):
+            async with bucket:
+                pass
+        assert loop.time() - start < 0.05
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  DATABASE (unit-level, mocked pool)
+# ═══════════════════════════════════════════════════════════════════
+
+
+def _mock_pool(conn) -> MagicMock:
+    """Build a pool whose acquire() / transaction() yield the given conn."""
+    acquire_ctx = AsyncMock()
+    acquire_ctx.__aenter__ = AsyncMock(return_value=conn)
+    acquire_ctx.__aexit__ = AsyncMock(return_value=False)
+    tx_ctx = AsyncMock()
+    tx_ctx.__aenter__ = AsyncMock(return_value=None)
+    tx_ctx.__aexit__ = AsyncMock(return_value=False)
+    conn.transaction = MagicMock(return_value=tx_ctx)
+    pool = MagicMock()
+    pool.acquire = MagicMock(return_value=acquire_ctx)
+    return pool
+
+
+class TestDatabase:
+    @pytest.mark.asyncio
+    async def test_insert_jobs_batch_uses_copy(self):
+        from database import Database
+        from models import JOB_COLUMNS
+
+        conn = AsyncMock()
+        conn.execute.return_value = "INSERT 0 2"
+        db = Database("postgres://unused")
+        db.pool = _mock_pool(conn)
+
+        jobs = [
+            {"id": "a", "title": "Dev", "salary_min": 100000.0},
+            {"id": "b", "title": "Ops", "embedding": [0.1]},
+        ]
+        inserted = await db.insert_jobs_batch(jobs)
+
+        assert inserted == 2
+        conn.copy_records_to_table.assert_awaited_once()
+        args, kwargs = conn.copy_records_to_table.call_args
+        assert args[0] == "_jobs_stage"
+        assert kwargs["columns"] == JOB_COLUMNS
+        first, second = kwargs["records"]
+        assert first[JOB_COLUMNS.index("salary_min")] == Decimal("100000.0")
+        assert first[JOB_COLUMNS.index("source")] == "hiring_cafe"
+        assert second[JOB_COLUMNS.index("embedding")] == "[0.1]"
+
+    @pytest.mark.asyncio
+    async def test_insert_job_records_isolates_bad_row(self):
+        import asyncpg
+        from database import Database
+        from models import JOB_COLUMNS
+
+        url = JOB_COLUMNS.index("source_url")
+        copied = []
+
+        async def copy(table, records, columns):
+            if any(r[url] == "bad" for r in records):
+                raise asyncpg.DataError("invalid input syntax")
+            copied.append(len(records))
+
+        async def execute(sql, *args):
+            return f"INSERT 0 {copied[-1]}" if copied and "INSERT" in sql else "CREATE"
+
+        conn = AsyncMock()
+        conn.copy_records_to_table.side_effect = copy
+        conn.execute.side_effect = execute
+        db = Database("postgres://unused")
+        db.pool = _mock_pool(conn)
+
+        records = []
+        for u in ("a", "b", "bad", "c"):
+            row = [None] * len(JOB_COLUMNS)
+            row[url] = u
+            records.append(tuple(row))
+
+        assert await db.insert_job_records(records) == 3
+        assert sum(copied) == 3
+
+    @pytest.mark.asyncio
+    async def test_insert_job_records_does_not_split_on_other_errors(self):
+        import asyncpg
+        from database import Database
+        from models import JOB_COLUMNS
+
+        conn = AsyncMock()
+        conn.copy_records_to_table.side_effect = asyncpg.InsufficientPrivilegeError(
+            "permission denied for table jobs"
+        )
+        db = Database("postgres://unused")
+        db.pool = _mock_pool(conn)
+
+        records = [tuple([None] * len(JOB_COLUMNS)) for _ in range(25)]
+
+        assert await db.insert_job_records(records) == 0
+        conn.copy_records_to_table.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_insert_jobs_batch_empty(self):
+        from database import Database
+
+        db = Database("postgres://unused")
+        assert await db.insert_jobs_batch([]) == 0
+
+    @pytest.mark.asyncio
+    async def test_update_embeddings_batch_single_statement(self):
+        from database import Database
+
+        conn = AsyncMock()
+        conn.execute.return_value = "UPDATE 2"
+        db = Database("postgres://unused")
+        db.pool = _mock_pool(conn)
+
+        assert await db.update_embeddings_batch([("a", [0.1]), ("b", [0.2, 0.3])]) == 2
+
+        conn.execute.assert_awaited_once()
+        args = conn.execute.call_args.args
+        assert "unnest" in args[0]
+        assert args[1] == ["a", "b"]
+        assert args[2] == ["[0.1]", "[0.2,0.3]"]
+
+    @pytest.mark.asyncio
+    async def test_get_all_source_ids_expands_keys(self):
+        from database import Database
+
+        conn = MagicMock()
+        conn.cursor = MagicMock(return_value=_async_chunks([
+            {"source_url": "https://hiring.cafe/viewjob/abc123", "source": "hiring_cafe"},
+            {"source_url": "https://boards.greenhouse.io/acme/jobs/42", "source": "greenhouse"},
+        ]))
+        db = Database("postgres://unused")
+        db.pool = _mock_pool(conn)
+
+        ids = await db.get_all_source_ids()
+
+        assert "abc123" in ids
+        assert "gh-acme-42" in ids
+        assert "https://boards.greenhouse.io/acme/jobs/42" in ids
+
+    @pytest.mark.asyncio
+    async def test_iter_source_urls_fills_known_ids(self):
+        from database import Database
+
+        rows = [
+            {"source_url": "https://hiring.cafe/viewjob/abc123", "source": "hiring_cafe"},
+            {"source_url": "https://boards.greenhouse.io/acme/jobs/42", "source": "greenhouse"},
+        ]
+        conn = MagicMock()
+        conn.cursor = MagicMock(return_value=_async_chunks(rows))
+        db = Database("postgres://unused")
+        db.pool = _mock_pool(conn)
+
+        known_ids = set()
+        chunks = [c async for c in db.iter_source_urls(known_ids=known_ids)]
+
+        assert chunks == [[r["source_url"] for r in rows]]
+        assert known_ids == {
+            "https://hiring.cafe/viewjob/abc123", "abc123",
+            "https://boards.greenhouse.io/acme/jobs/42", "gh-acme-42",
+        }
+        conn.cursor.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_stats_single_query(self):
+        from database import Database
+
+        conn = AsyncMock()
+        conn.fetch.return_value = [
+            {"source": "remotive", "cnt": 3, "active": 2, "embedded": 1, "remote": 3},
+            {"source": "greenhouse", "cnt": 2, "active": 2, "embedded": 2, "remote": 0},
+        ]
+        db = Database("postgres://unused")
+        db.pool = _mock_pool(conn)
+
+        stats = await db.get_stats()
+
+        conn.fetch.assert_awaited_once()
+        conn.fetchval.assert_not_awaited()
+        assert stats["total_jobs"] == 5
+        assert stats["active_jobs"] == 4
+        assert stats["jobs_with_embeddings"] == 3
+        assert stats["remote_jobs"] == 3
+        assert stats["by_source"] == {"remotive": 3, "greenhouse": 2}
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -625,7 +1158,7 @@ class TestPipeline:
         mock_db.get_existing_source_urls.return_value = {
             "https://hiring.cafe/viewjob/dup1",
         }
-        mock_db.insert_jobs_batch.return_value = 1
+        mock_db.insert_job_records.return_value = 1
 
         pipeline = JobProcessingPipeline(database=mock_db, batch_size=10)
 
@@ -658,7 +1191,7 @@ class TestPipeline:
 
         mock_db = AsyncMock()
         mock_db.get_existing_source_urls.return_value = set()
-        mock_db.insert_jobs_batch.return_value = 2
+        mock_db.insert_job_records.return_value = 2
 
         pipeline = JobProcessingPipeline(
             database=mock_db, embedding_service=None, batch_size=10
@@ -687,6 +1220,90 @@ class TestPipeline:
         assert metrics.jobs_embedded == 0
         assert metrics.jobs_stored == 2
 
+    @pytest.mark.asyncio
+    async def test_process_drops_in_batch_repeats_before_embedding(self):
+        from pipeline import JobProcessingPipeline
+
+        mock_db = AsyncMock()
+        mock_db.get_existing_urls.return_value = set()
+        mock_db.insert_job_records.return_value = 1
+        embedder = AsyncMock()
+        embedder.embed_scraped_jobs.side_effect = lambda jobs: [None] * len(jobs)
+
+        pipeline = JobProcessingPipeline(
+            database=mock_db, embedding_service=embedder, batch_size=10
+        )
+
+        jobs = [
+            _make_job(title="Same Job", source_url="https://example.com/same")
+            for _ in range(2)
+        ]
+
+        metrics = await pipeline.process(jobs)
+
+        assert metrics.duplicates_skipped == 1
+        embedded_jobs = embedder.embed_scraped_jobs.call_args.args[0]
+        assert len(embedded_jobs) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_process_calls_keep_separate_metrics(self):
+        from pipeline import JobProcessingPipeline
+
+        mock_db = AsyncMock()
+        mock_db.get_existing_urls.return_value = set()
+        mock_db.insert_job_records.side_effect = lambda rows: len(rows)
+
+        pipeline = JobProcessingPipeline(database=mock_db, batch_size=10)
+
+        def make(source, n):
+            return [
+                _make_job(
+                    title=f"{source} job {i}",
+                    source=source,
+                    source_url=f"https://{source}.example.com/{i}",
+                )
+                for i in range(n)
+            ]
+
+        first, second = await asyncio.gather(
+            pipeline.process(make("remotive", 2)),
+            pipeline.process(make("arbeitnow", 3)),
+        )
+
+        assert (first.jobs_found, first.jobs_stored) == (2, 2)
+        assert (second.jobs_found, second.jobs_stored) == (3, 3)
+
+    @pytest.mark.asyncio
+    async def test_process_stores_batches_in_order(self):
+        from models import JOB_COLUMNS
+        from pipeline import JobProcessingPipeline
+
+        mock_db = AsyncMock()
+        mock_db.get_existing_urls.return_value = set()
+        stored_titles = []
+
+        async def insert(rows):
+            stored_titles.extend(r[JOB_COLUMNS.index("title")] for r in rows)
+            return len(rows)
+
+        mock_db.insert_job_records.side_effect = insert
+        embedder = AsyncMock()
+        embedder.embed_scraped_jobs.side_effect = lambda jobs: [[1.0]] * len(jobs)
+
+        pipeline = JobProcessingPipeline(
+            database=mock_db, embedding_service=embedder, batch_size=1
+        )
+        jobs = [
+            _make_job(title=f"Job {i}", source_url=f"https://example.com/{i}")
+            for i in range(4)
+        ]
+
+        metrics = await pipeline.process(jobs)
+
+        assert stored_titles == ["Job 0", "Job 1", "Job 2", "Job 3"]
+        assert metrics.jobs_embedded == 4
+        assert metrics.jobs_stored == 4
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  EMBEDDING SERVICE (unit-level, mocked Voyage client)
@@ -727,6 +1344,35 @@ class TestEmbeddingService:
             text = service._prepare_text({})
             assert text == ""
 
+    @pytest.mark.asyncio
+    async def test_embed_scraped_jobs_matches_dict_text(self):
+        with patch.dict("sys.modules", {"voyageai": MagicMock()}):
+            from embedding_service import VoyageEmbeddingService
+
+            service = VoyageEmbeddingService.__new__(VoyageEmbeddingService)
+            service.total_tokens_consumed = 0
+            service.embed_batch = AsyncMock(return_value=[[0.5]])
+
+            job = _make_job(
+                title="Backend Engineer",
+                company_name="TechCo",
+                description="Build scalable systems",
+                skills_required=["Python", "Go"],
+                salary_min=Decimal("120000"),
+                remote=True,
+            )
+
+            assert await service.embed_scraped_jobs([job]) == [[0.5]]
+            text = service.embed_batch.call_args.args[0][0]
+            assert text == service._prepare_text({
+                "job_title": "Backend Engineer",
+                "company_name": "TechCo",
+                "job_description": "Build scalable systems",
+                "skills_required": ["Python", "Go"],
+                "salary_min": 120000.0,
+                "remote": True,
+            })
+
     def test_embedding_dim_is_768(self):
         with patch.dict("sys.modules", {"voyageai": MagicMock()}):
             from embedding_service import VoyageEmbeddingService
@@ -749,6 +1395,86 @@ class TestEmbeddingService:
             if original is not None:
                 os.environ["VOYAGE_MODEL"] = original
 
+    @pytest.mark.asyncio
+    async def test_embed_batch_coalesces_concurrent_callers(self):
+        with patch.dict("sys.modules", {"voyageai": MagicMock()}):
+            from embedding_service import VoyageEmbeddingService
+
+            service = VoyageEmbeddingService.__new__(VoyageEmbeddingService)
+            service.max_batch_size = 128
+            service._pending = None
+            service._coalescer = None
+            service._flushes = set()
+
+            calls = []
+
+            async def fake_request(texts, input_type="document"):
+                calls.append(list(texts))
+                return [[float(len(t))] for t in texts]
+
+            service._embed_batch_request = fake_request
+
+            first, second = await asyncio.gather(
+                service.embed_batch(["a", "bb"]),
+                service.embed_batch(["ccc"]),
+            )
+            await service.close()
+
+            assert first == [[1.0], [2.0]]
+            assert second == [[3.0]]
+            assert calls == [["a", "bb", "ccc"]]
+
+    @pytest.mark.asyncio
+    async def test_close_releases_waiting_callers(self):
+        with patch.dict("sys.modules", {"voyageai": MagicMock()}):
+            from embedding_service import VoyageEmbeddingService
+
+            service = VoyageEmbeddingService.__new__(VoyageEmbeddingService)
+            service.max_batch_size = 128
+            service._pending = None
+            service._coalescer = None
+            service._flushes = set()
+
+            async def never_returns(texts, input_type="document"):
+                await asyncio.Event().wait()
+
+            service._embed_batch_request = never_returns
+
+            waiter = asyncio.create_task(service.embed_batch(["a"]))
+            await asyncio.sleep(0.1)  # past the coalesce window: request in flight
+            assert len(service._flushes) == 1
+
+            for task in service._flushes:
+                task.cancel()
+            await service.close()
+
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(waiter, 1)
+
+    @pytest.mark.asyncio
+    async def test_worker_waits_after_failed_write(self):
+        with patch.dict("sys.modules", {"voyageai": MagicMock()}):
+            from embedding_service import EmbeddingWorker
+
+            jobs = [{"id": str(i), "title": "Dev"} for i in range(2)]
+            db = AsyncMock()
+            db.get_jobs_without_embeddings.return_value = jobs
+            db.update_embeddings_batch.return_value = 0  # write failed
+            embedder = MagicMock(max_batch_size=2)
+            embedder.embed_jobs = AsyncMock(
+                side_effect=lambda js: [{**j, "embedding": [0.1]} for j in js]
+            )
+            worker = EmbeddingWorker(db, embedder, interval_seconds=60)
+
+            async def sleep(seconds):
+                assert seconds == 60
+                worker.stop()
+
+            with patch("embedding_service.asyncio.sleep", side_effect=sleep):
+                await asyncio.wait_for(worker.start(), 1)
+
+            embedder.embed_jobs.assert_awaited_once()
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  JANITOR (unit-level)
@@ -814,6 +1540,135 @@ class TestHealthCheck:
         assert server.status["jobs_in_db"] == 500
         assert server.status["last_scrape"] == "2025-01-01T00:00:00"
 
+    @pytest.mark.asyncio
+    async def test_health_check_returns_json(self):
+        from health import HealthCheckServer
+
+        server = HealthCheckServer(port=9999)
+        server.update_status(consecutive_failures=3)
+        resp = await server.health_check(MagicMock())
+
+        assert resp.status == 503
+        assert resp.content_type == "application/json"
+        assert json.loads(resp.body)["status"] == "unhealthy"
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  CONFIG
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestConfig:
+    def test_from_env_is_frozen(self, monkeypatch):
+        import dataclasses
+        from config import Config
+
+        monkeypatch.setenv("DATABASE_URL", "postgres://x")
+        monkeypatch.setenv("HEALTH_PORT", "9090")
+        config = Config.from_env()
+
+        assert config.database_url == "postgres://x"
+        assert config.health_port == 9090
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.health_port = 1
+
+
+class TestRunSpider:
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_reported_not_lost(self):
+        from main import ScraperSystem
+
+        class FakeSpider:
+            SOURCE_NAME = "fake"
+            errors = 0
+
+            async def scrape(self, known_ids=None):
+                for i in range(5):
+                    yield i
+
+        async def process(jobs):
+            if jobs == [0, 1]:
+                raise RuntimeError("db down")
+            return MagicMock(jobs_stored=len(jobs))
+
+        system = ScraperSystem.__new__(ScraperSystem)
+        system.pipeline = MagicMock(batch_size=2, process=AsyncMock(side_effect=process))
+        system.db = MagicMock(get_stats=AsyncMock())
+        system.health = MagicMock()
+        system._consecutive_failures = 0
+
+        name, result = await system._run_spider(FakeSpider(), set())
+
+        assert name == "fake"
+        assert "error" not in result
+        assert result == {"scraped": 5, "stored": 3, "errors": 1}
+        assert system.pipeline.process.await_count == 3
+        system.db.get_stats.assert_not_awaited()
+
+    @staticmethod
+    def _system(process):
+        from main import ScraperSystem
+
+        system = ScraperSystem.__new__(ScraperSystem)
+        system.pipeline = MagicMock(batch_size=1, process=AsyncMock(side_effect=process))
+        system.health = MagicMock()
+        system._consecutive_failures = 0
+        return system
+
+    @pytest.mark.asyncio
+    async def test_spider_waits_for_a_free_flush_slot(self):
+        release = asyncio.Event()
+        produced = []
+
+        class FakeSpider:
+            SOURCE_NAME = "fake"
+            errors = 0
+
+            async def scrape(self, known_ids=None):
+                for i in range(10):
+                    produced.append(i)
+                    yield i
+
+        async def process(jobs):
+            await release.wait()
+            return MagicMock(jobs_stored=len(jobs))
+
+        system = self._system(process)
+        run = asyncio.create_task(system._run_spider(FakeSpider(), set()))
+        await asyncio.sleep(0.05)
+
+        # Two batches in flight, the third built and waiting for a slot
+        assert len(produced) == 3
+
+        release.set()
+        _, result = await run
+        assert result == {"scraped": 10, "stored": 10, "errors": 0}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_spider_cancels_its_flushes(self):
+        started = []
+
+        class FakeSpider:
+            SOURCE_NAME = "fake"
+            errors = 0
+
+            async def scrape(self, known_ids=None):
+                yield 0
+                await asyncio.Event().wait()
+
+        async def process(jobs):
+            started.append(asyncio.current_task())
+            await asyncio.Event().wait()
+
+        system = self._system(process)
+        run = asyncio.create_task(system._run_spider(FakeSpider(), set()))
+        await asyncio.sleep(0.05)
+        run.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await run
+        assert len(started) == 1 and started[0].cancelled()
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  INTEGRATION-ISH: Spider scrape flow with mocked HTTP
@@ -832,7 +1687,7 @@ class TestSpiderScrapeFlow:
         # Mock count response
         count_response = AsyncMock()
         count_response.status = 200
-        count_response.json = AsyncMock(return_value={"total": 1})
+        count_response.read = AsyncMock(return_value=b'{"total": 1}')
         count_ctx = AsyncMock()
         count_ctx.__aenter__ = AsyncMock(return_value=count_response)
         count_ctx.__aexit__ = AsyncMock(return_value=False)
@@ -840,9 +1695,9 @@ class TestSpiderScrapeFlow:
         # Mock search response
         search_response = AsyncMock()
         search_response.status = 200
-        search_response.json = AsyncMock(return_value={
+        search_response.read = AsyncMock(return_value=json.dumps({
             "results": [{"requisition_id": "abc123xyz"}]
-        })
+        }).encode())
         search_ctx = AsyncMock()
         search_ctx.__aenter__ = AsyncMock(return_value=search_response)
         search_ctx.__aexit__ = AsyncMock(return_value=False)
@@ -850,7 +1705,7 @@ class TestSpiderScrapeFlow:
         # Mock detail response
         detail_response = AsyncMock()
         detail_response.status = 200
-        detail_response.json = AsyncMock(return_value=sample_job_info)
+        detail_response.read = AsyncMock(return_value=json.dumps(sample_job_info).encode())
         detail_ctx = AsyncMock()
         detail_ctx.__aenter__ = AsyncMock(return_value=detail_response)
         detail_ctx.__aexit__ = AsyncMock(return_value=False)
@@ -874,7 +1729,7 @@ class TestSpiderScrapeFlow:
         mock_session.closed = False
 
         # Override throttle for speed
-        spider._min_interval = 0.0
+        spider._throttle = AsyncMock()
 
         jobs = await spider.scrape_all()
 
@@ -885,6 +1740,103 @@ class TestSpiderScrapeFlow:
         assert spider.pages_scraped == 1
         assert spider.detail_fetches == 1
 
+    @pytest.mark.asyncio
+    async def test_next_page_prefetched_while_consuming(self, spider):
+        offsets = []
+
+        async def search_page(offset):
+            offsets.append(offset)
+            return {"results": [{"requisition_id": f"r{offset}"}]}
+
+        spider._ensure_build_id = AsyncMock()
+        spider._get_total_count = AsyncMock(return_value=0)
+        spider._search_page = search_page
+        spider._parse_job = lambda card, description=None: MagicMock(requisition_id=card["requisition_id"])
+
+        loop = spider._run_scrape_loop(set(), 0, total=None)
+        first = await loop.__anext__()
+        await asyncio.sleep(0)  # let the prefetch task run
+
+        assert first.requisition_id == "r0"
+        assert offsets == [0, 10]
+
+        await loop.aclose()
+        assert offsets == [0, 10]
+
+    @pytest.mark.asyncio
+    async def test_known_total_fans_out_search_pages(self, spider):
+        offsets = []
+
+        async def search_page(offset):
+            offsets.append(offset)
+            return {"results": [{"requisition_id": f"r{offset}"}]}
+
+        spider._ensure_build_id = AsyncMock()
+        spider._get_total_count = AsyncMock(return_value=35)
+        spider._search_page = search_page
+        spider._parse_job = lambda card, description=None: MagicMock(requisition_id=card["requisition_id"])
+
+        loop = spider._run_scrape_loop(set(), 0, total=None)
+        first = await loop.__anext__()
+        await asyncio.sleep(0)
+
+        assert first.requisition_id == "r0"
+        assert offsets == [0, 10, 20, 30]
+
+        rest = [job.requisition_id async for job in loop]
+        assert rest == ["r10", "r20", "r30"]
+        assert offsets == [0, 10, 20, 30]
+
+    @pytest.mark.asyncio
+    async def test_probed_total_not_requested_again(self, spider):
+        spider._ensure_build_id = AsyncMock()
+        spider._get_total_count = AsyncMock(return_value=0)
+        spider._search_page = AsyncMock(return_value={"results": []})
+
+        jobs = [job async for job in spider._run_scrape_loop(set(), 0, total=35)]
+
+        assert jobs == []
+        spider._get_total_count.assert_not_awaited()
+
+    def test_parse_total(self):
+        assert HiringCafeSpider._parse_total(42) == 42
+        assert HiringCafeSpider._parse_total({"count": 7}) == 7
+        assert HiringCafeSpider._parse_total("oops") == 0
+
+    @pytest.mark.asyncio
+    async def test_html_conversion_survives_shut_down_pool(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        pool.shutdown()
+        spider = HiringCafeSpider(cpu_pool=pool)
+
+        htmls = [f"<p>{i}{'x' * 100_000}</p>" for i in range(4)]
+        texts = await spider._html_to_text_many(htmls)
+
+        assert [t[:1] for t in texts] == ["0", "1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_detail_fetches_bounded_concurrency(self):
+        spider = HiringCafeSpider(requests_per_minute=600, detail_concurrency=3)
+        in_flight = peak = 0
+
+        async def fetch_detail(req_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return None if req_id == "r3" else {"requisition_id": req_id}
+
+        spider._fetch_job_detail = fetch_detail
+        spider._parse_job = lambda raw: MagicMock(requisition_id=raw["requisition_id"])
+
+        jobs = [job async for job in spider._fetch_details([f"r{i}" for i in range(8)])]
+
+        assert sorted(j.requisition_id for j in jobs) == ["r0", "r1", "r2", "r4", "r5", "r6", "r7"]
+        assert peak == 3
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])